@@ -1,4 +1,5 @@
 import os
+import argparse
 import django
 from django.conf import settings
 
@@ -6,14 +7,19 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'restaurant_api.settings')
 django.setup()
 
 from menu.models import MenuItem, Promotion
-from django.core.files import File
-import requests
-from io import BytesIO
 from django.utils import timezone
 from datetime import timedelta
+from scripts.image_cache import ImageCache
+from scripts.http_client import set_image_base_url
+from scripts.image_fetch import DEFAULT_WORKERS, fetch_images
+from scripts.media_utils import save_image_download
+from scripts.run_plan import RunPlan
+from scripts.profiling import RunProfile, phase
+from scripts.seed_utils import plan_rows
+from scripts.promotion_pricing import DEFAULT_OUTPUT as PRICING_OUTPUT, refresh_pricing_file
 
-def add_images_and_promotions():
-    print("🖼️ Adding images to menu items...")
+def add_images_and_promotions(workers=DEFAULT_WORKERS, plan=False):
+    print("🖼️ Planning images and promotions..." if plan else "🖼️ Adding images to menu items and promotions...")
     
     # Menu items uchun rasmlar
     menu_images = {
@@ -30,28 +36,6 @@ def add_images_and_promotions():
         'Matcha Tiramisu': 'https://images.unsplash.com/photo-1578985545062-69928b1d9587?w=400&h=300&fit=crop'
     }
 
-    # Menu items'ga rasmlar qo'shish
-    for item_name, image_url in menu_images.items():
-        try:
-            item = MenuItem.objects.get(name=item_name)
-            if not item.image:
-                response = requests.get(image_url, timeout=10)
-                if response.status_code == 200:
-                    image_file = BytesIO(response.content)
-                    filename = f"{item_name.lower().replace(' ', '_')}.jpg"
-                    item.image.save(filename, File(image_file), save=True)
-                    print(f"✅ Added image for {item_name}")
-                else:
-                    print(f"❌ Failed to download image for {item_name}")
-            else:
-                print(f"⏭️  {item_name} already has an image")
-        except MenuItem.DoesNotExist:
-            print(f"❌ Menu item {item_name} not found")
-        except Exception as e:
-            print(f"❌ Error adding image for {item_name}: {e}")
-
-    print("\n🎯 Adding images to promotions...")
-    
     # Promotion rasmlari
     promotion_images = {
         'Sushi Combo': 'https://images.unsplash.com/photo-1579584425555-c3ce17fd4351?w=400&h=300&fit=crop',
@@ -59,26 +43,53 @@ def add_images_and_promotions():
         'Happy Hour': 'https://images.unsplash.com/photo-1556679343-c7306c1976bc?w=400&h=300&fit=crop'
     }
 
-    for promo_name, image_url in promotion_images.items():
-        try:
-            promo = Promotion.objects.get(title=promo_name)
-            if not promo.image:
-                response = requests.get(image_url, timeout=10)
-                if response.status_code == 200:
-                    image_file = BytesIO(response.content)
-                    filename = f"{promo_name.lower().replace(' ', '_')}.jpg"
-                    promo.image.save(filename, File(image_file), save=True)
-                    print(f"✅ Added image for promotion: {promo_name}")
-                else:
-                    print(f"❌ Failed to download image for promotion: {promo_name}")
+    with phase('images'):
+        # Obyektlar har bir model uchun bitta so'rov bilan olinadi
+        items = {item.name: item for item in MenuItem.objects.filter(name__in=menu_images)}
+        promos = {promo.title: promo for promo in Promotion.objects.filter(title__in=promotion_images)}
+
+        targets = {}
+        jobs = []
+        for item_name, image_url in menu_images.items():
+            item = items.get(item_name)
+            if item is None:
+                print(f"❌ Menu item {item_name} not found")
+            elif item.image:
+                print(f"⏭️  {item_name} already has an image")
             else:
+                targets[('item', item_name)] = item
+                jobs.append((('item', item_name), image_url))
+
+        for promo_name, image_url in promotion_images.items():
+            promo = promos.get(promo_name)
+            if promo is None:
+                print(f"❌ Promotion {promo_name} not found")
+            elif promo.image:
                 print(f"⏭️  Promotion {promo_name} already has an image")
-        except Promotion.DoesNotExist:
-            print(f"❌ Promotion {promo_name} not found")
-        except Exception as e:
-            print(f"❌ Error adding image for promotion {promo_name}: {e}")
+            else:
+                targets[('promotion', promo_name)] = promo
+                jobs.append((('promotion', promo_name), image_url))
+
+        if plan:
+            run_plan = RunPlan("add_images_promotions")
+            run_plan.add_images('images', jobs, cache=ImageCache(), workers=workers, reads=2)
+        else:
+            # Yuklab olish parallel, saqlash esa bitta oqimda bajariladi
+            print(f"\n📥 Downloading {len(jobs)} images with {workers} workers...")
+            for key, download, error in fetch_images(jobs, workers=workers, cache=ImageCache()):
+                kind, name = key
+                label = name if kind == 'item' else f"promotion: {name}"
+                if error is not None:
+                    print(f"❌ Failed to download image for {label} ({error})")
+                    continue
+                try:
+                    save_image_download(targets[key], download)
+                    print(f"✅ Added image for {label}")
+                except Exception as e:
+                    print(f"❌ Error adding image for {label}: {e}")
 
-    print("\n🎉 Adding new promotions...")
+    if not plan:
+        print("\n🎉 Adding new promotions...")
     
     # Yangi aksiyalar qo'shish
     new_promotions = [
@@ -136,15 +147,44 @@ def add_images_and_promotions():
         }
     ]
 
-    for promo_data in new_promotions:
-        if not Promotion.objects.filter(title=promo_data['title']).exists():
-            Promotion.objects.create(**promo_data)
-            print(f"✅ Created new promotion: {promo_data['title']}")
-        else:
-            print(f"⏭️  Promotion {promo_data['title']} already exists")
+    if plan:
+        # Har bir aksiya: exists() + save() (signallar uchun bittalab yaratiladi)
+        run_plan.add_rows('new promotion', plan_rows(Promotion, 'title', new_promotions, compare=False),
+                          reads=len(new_promotions), per_row=True)
+        run_plan.report()
+        return run_plan
+
+    with phase('promotions'):
+        for promo_data in new_promotions:
+            if not Promotion.objects.filter(title=promo_data['title']).exists():
+                Promotion.objects.create(**promo_data)
+                print(f"✅ Created new promotion: {promo_data['title']}")
+            else:
+                print(f"⏭️  Promotion {promo_data['title']} already exists")
+
+        if refresh_pricing_file(Promotion, MenuItem, PRICING_OUTPUT):
+            print("✅ Promotion pricing table refreshed")
 
     print("\n🎉 All images and promotions added successfully!")
 
 if __name__ == '__main__':
-    add_images_and_promotions()
+    parser = argparse.ArgumentParser(description="Add images and promotions")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help="Number of concurrent image downloads")
+    parser.add_argument('--plan', action='store_true',
+                        help="Only report pending downloads, transfer volume and queries (no writes)")
+    parser.add_argument('--profile', nargs='?', const='-', metavar='PATH',
+                        help="Print (or write to PATH) a JSON summary of queries, time and bytes per phase")
+    parser.add_argument('--image-base-url', default=None,
+                        help="Fetch images from this server instead of the real hosts "
+                             "(default: $TOKYO_IMAGE_BASE_URL), e.g. scripts/fake_server.py")
+    args = parser.parse_args()
+    if args.image_base_url:
+        set_image_base_url(args.image_base_url)
+    if args.profile and not args.plan:
+        with RunProfile('add_images_promotions') as profile:
+            add_images_and_promotions(args.workers)
+        profile.write(args.profile)
+    else:
+        add_images_and_promotions(args.workers, plan=args.plan)
 
@@ -0,0 +1,12 @@
+"""
+Offline benchmarks for the Python data, image and logo tooling
+
+Run from the repository root:
+
+    python -m benchmarks.run --out results.json
+    python -m benchmarks.run --only logos,images --compare previous.json
+
+Nothing leaves the machine: the catalog is seeded into a temporary SQLite
+database, images are served by a local fixture HTTP server and all test
+images are generated on the fly.
+"""
@@ -0,0 +1,117 @@
+"""
+Image pipeline benchmarks against the local stand-in server
+(scripts/fake_server.py)
+
+- add_images_via_api.main: the whole resolve -> download -> PATCH
+  pipeline over a fresh stand-in catalog, with a temporary journal and
+  caches (rate limits raised so the server latency dominates)
+- fetch_images: cold (no cache) with 1 and DEFAULT_WORKERS threads, and
+  warm (every URL already in a temporary ImageCache)
+- stream_download of a single large image
+- generate_derivatives of one photo-sized JPEG
+"""
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+
+from benchmarks.common import measure, result
+from scripts.downloads import stream_download
+from scripts.fake_server import FakeTokyoServer, fixture_jpeg
+from scripts.http_client import image_base_url, make_session, set_image_base_url
+from scripts.image_cache import ImageCache
+from scripts.image_derivatives import generate_derivatives
+from scripts.image_fetch import DEFAULT_WORKERS, fetch_images
+from scripts.resolve_cache import TTLCache
+
+GROUP = 'images'
+DEFAULT_COUNT = 48
+DEFAULT_LATENCY = 0.02  # seconds per request, roughly a nearby CDN
+LARGE_SIZE = (3000, 2000)
+PIPELINE_RPS = 1000
+
+
+def _session(workers):
+    session = make_session(workers)
+    # Mahalliy server proksi orqali so'ralmasin
+    session.trust_env = False
+    return session
+
+
+def _drain(jobs, workers, cache=None):
+    failed = 0
+    for _, download, error in fetch_images(jobs, workers=workers, session=_session(workers), cache=cache):
+        failed += error is not None
+    if failed:
+        raise RuntimeError(f"{failed} fixture downloads failed")
+
+
+def _api_pipeline(count, latency, repeat):
+    """Time add_images_via_api.main() against a stand-in catalog of `count` items"""
+    from scripts import add_images_via_api as api
+
+    work_dir = tempfile.mkdtemp(prefix='tokyo-bench-api-')
+    previous_base = image_base_url()
+    try:
+        with FakeTokyoServer(('127.0.0.1', 0), items=count, latency=latency) as server:
+            api.configure_endpoints(f"{server.base_url}/api", server.base_url)
+            api.configure_rate_limits(PIPELINE_RPS, PIPELINE_RPS)
+
+            def setup():
+                # Har bir o'lchov toza katalog, jurnal va keshlardan boshlanadi
+                server.reset()
+                shutil.rmtree(work_dir)
+                os.makedirs(work_dir)
+                api.image_cache = ImageCache(root=os.path.join(work_dir, 'images'))
+                api.resolve_cache = TTLCache(os.path.join(work_dir, 'resolve.json'))
+                api.image_sources.failure_cache = api.resolve_cache
+
+            def pipeline():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    api.main(journal_path=os.path.join(work_dir, 'journal.jsonl'))
+                missing = [item['id'] for item in server.items.values() if not item['image']]
+                if missing:
+                    raise RuntimeError(f"{len(missing)} stand-in items got no image")
+
+            durations = measure(pipeline, repeat, setup=setup)
+            uploads = server.stats['patches']
+    finally:
+        set_image_base_url(previous_base)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return result(GROUP, 'add_images_via_api.pipeline', durations, extra={'uploads': uploads},
+                  items=count, latency=latency)
+
+
+def run(count=DEFAULT_COUNT, latency=DEFAULT_LATENCY, repeat=3):
+    results = [_api_pipeline(count, latency, repeat)]
+
+    with FakeTokyoServer(('127.0.0.1', 0), latency=latency) as server:
+        jobs = [(index, f"{server.base_url}/images.example.com/{index}.jpg") for index in range(count)]
+        for workers in (1, DEFAULT_WORKERS):
+            results.append(result(GROUP, 'fetch_images.cold', measure(lambda: _drain(jobs, workers), repeat),
+                                  images=count, workers=workers, latency=latency))
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ImageCache(root=cache_dir)
+            _drain(jobs, DEFAULT_WORKERS, cache)
+            results.append(result(GROUP, 'fetch_images.warm',
+                                  measure(lambda: _drain(jobs, DEFAULT_WORKERS, cache), repeat),
+                                  images=count, workers=DEFAULT_WORKERS))
+
+    width, height = LARGE_SIZE
+    with FakeTokyoServer(('127.0.0.1', 0)) as server:
+        session = _session(1)
+        url = f"{server.base_url}/images.example.com/large.jpg?w={width}&h={height}"
+        size = len(session.get(url).content)
+
+        def download():
+            stream_download(session.get, url).close()
+
+        results.append(result(GROUP, 'stream_download', measure(download, repeat), bytes=size))
+
+    large = fixture_jpeg(width, height, seed=99, quality=92)
+    results.append(result(GROUP, 'generate_derivatives',
+                          measure(lambda: list(generate_derivatives(large)), repeat),
+                          width=width, height=height))
+    return results
@@ -0,0 +1,45 @@
+"""
+Logo routine benchmarks on synthetic 1, 4 and 12 MP images
+"""
+import contextlib
+import io
+import os
+import tempfile
+
+from benchmarks.common import measure, result
+from benchmarks.fixtures import logo_image
+from scripts.logo_tools import dominant_colors, find_color_bboxes, remove_green_background
+
+DEFAULT_MEGAPIXELS = (1, 4, 12)
+GROUP = 'logos'
+
+
+def run(megapixels=DEFAULT_MEGAPIXELS, repeat=3):
+    from create_logo_v3 import create_logo_with_exact_size
+
+    results = []
+    for mp in megapixels:
+        img = logo_image(mp)
+        rgba = img.convert('RGBA')
+        ranges = [((0, 130, 0), (100, 210, 120)), ((170, 0, 0), (250, 70, 80))]
+
+        results.append(result(GROUP, 'remove_green_background',
+                              measure(lambda: remove_green_background(rgba), repeat), megapixels=mp))
+        results.append(result(GROUP, 'dominant_colors',
+                              measure(lambda: dominant_colors(img, top_k=20, quantize_bits=6), repeat),
+                              megapixels=mp))
+        results.append(result(GROUP, 'find_color_bboxes',
+                              measure(lambda: find_color_bboxes(rgba, ranges), repeat), megapixels=mp))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source, output = os.path.join(tmp, 'in.png'), os.path.join(tmp, 'out.png')
+            img.save(source)
+
+            def exact_size():
+                # Skript natijalarini chop etadi, benchmark chiqishi toza qolsin
+                with contextlib.redirect_stdout(io.StringIO()):
+                    create_logo_with_exact_size(source, output)
+
+            results.append(result(GROUP, 'create_logo_with_exact_size', measure(exact_size, repeat),
+                                  megapixels=mp))
+    return results
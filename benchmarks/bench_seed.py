@@ -0,0 +1,179 @@
+"""
+Catalog seeding benchmarks against a temporary SQLite database
+
+For each catalog size the menu items are written by bulk_create_missing
+into an empty table, written again (everything exists), synced with 1% of
+the prices changed (sync_rows), and compiled into the search index. Query
+counts come from scripts/profiling.py.
+
+The image writer of add_images_promotions.py is timed on the seed catalog
+(seed_data/tokyo), with the images served by scripts/fake_server.py and
+a temporary image cache, media root and pricing file.
+
+The `menu` app lives in the backend, which is not part of this
+repository: point --backend-dir (or TOKYO_BACKEND_DIR) at the directory
+that contains it.
+"""
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import warnings
+
+from benchmarks.common import measure, result
+from benchmarks.fixtures import synthetic_catalog
+
+GROUP = 'seed'
+DEFAULT_SIZES = (100, 10_000, 100_000)
+CATEGORY_COUNT = 20
+SEED_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'seed_data', 'tokyo')
+WRITER_LATENCY = 0.02
+
+
+def setup_django(backend_dir=None, db_dir=None):
+    """Configure Django with a throwaway SQLite database and create the tables"""
+    import django
+    from django.conf import settings
+    from django.core.management import call_command
+
+    backend_dir = backend_dir or os.environ.get('TOKYO_BACKEND_DIR')
+    if backend_dir:
+        sys.path.insert(0, backend_dir)
+    db_dir = db_dir or tempfile.mkdtemp(prefix='tokyo-bench-')
+    if not settings.configured:
+        settings.configure(
+            DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3',
+                                   'NAME': os.path.join(db_dir, 'bench.sqlite3')}},
+            INSTALLED_APPS=['django.contrib.auth', 'django.contrib.contenttypes', 'menu'],
+            MEDIA_ROOT=os.path.join(db_dir, 'media'),
+            USE_TZ=True,
+            DEFAULT_AUTO_FIELD='django.db.models.BigAutoField',
+        )
+    django.setup()
+    call_command('migrate', run_syncdb=True, verbosity=0)
+
+
+def _queries(func):
+    from scripts.profiling import RunProfile, phase
+
+    with RunProfile('bench') as profile:
+        with phase('bench'):
+            func()
+    return profile.phases['bench']['queries']
+
+
+def run(sizes=DEFAULT_SIZES, repeat=1, backend_dir=None):
+    setup_django(backend_dir)
+    from menu.models import Category, MenuItem
+    from scripts.search_index import LIST_FIELDS, TEXT_FIELDS, build_search_index
+    from scripts.seed_utils import bulk_create_missing, sync_rows
+
+    categories = [Category(name=f"Bench category {index}") for index in range(CATEGORY_COUNT)]
+    Category.objects.bulk_create(categories)
+    category_ids = list(Category.objects.values_list('id', flat=True))
+
+    def clear():
+        MenuItem.objects.all().delete()
+
+    results = []
+    for size in sizes:
+        rows = list(synthetic_catalog(size, category_ids))
+        changed = [dict(row, price=f"{float(row['price']) + 500:.2f}") if index % 100 == 0 else row
+                   for index, row in enumerate(rows)]
+
+        def create():
+            with contextlib.redirect_stdout(io.StringIO()):
+                bulk_create_missing(MenuItem, 'name', iter(rows), 'menu item')
+
+        def reseed():
+            clear()
+            create()
+
+        def sync():
+            with contextlib.redirect_stdout(io.StringIO()):
+                sync_rows(MenuItem, 'name', iter(changed), 'menu item')
+
+        def index():
+            values = MenuItem.objects.values('id', 'category_id', *TEXT_FIELDS, *LIST_FIELDS).iterator()
+            build_search_index(values)
+
+        # So'rovlar soni alohida, profilsiz o'lchovdan oldin hisoblanadi
+        clear()
+        queries = _queries(create)
+        results.append(result(GROUP, 'bulk_create_missing.empty', measure(create, repeat, setup=clear),
+                              extra={'queries': queries}, items=size))
+        results.append(result(GROUP, 'bulk_create_missing.existing', measure(create, repeat),
+                              extra={'queries': _queries(create)}, items=size))
+
+        reseed()
+        queries = _queries(sync)
+        results.append(result(GROUP, 'sync_rows.1pct_changed', measure(sync, repeat, setup=reseed),
+                              extra={'queries': queries}, items=size))
+        results.append(result(GROUP, 'build_search_index', measure(index, repeat), items=size))
+    clear()
+    Category.objects.all().delete()
+    results.append(_image_writer(repeat))
+    return results
+
+
+def _image_writer(repeat):
+    """Time add_images_and_promotions() (download + save + new promotions) on the seed catalog"""
+    from django.conf import settings
+    from menu.models import Category, MenuItem, Promotion
+    from scripts.fake_server import FakeTokyoServer
+    from scripts.http_client import image_base_url, set_image_base_url
+    from scripts.profiling import RunProfile
+    from scripts.seed_loader import category_id_map, find_data_file, iter_records, resolve_categories
+    from scripts.seed_utils import bulk_create_missing
+
+    # Seed fayllaridagi sanalar vaqt zonasisiz (create_tokyo_data.py bilan bir xil ogohlantirish)
+    with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        import add_images_promotions as writer
+
+        bulk_create_missing(Category, 'name', iter_records(find_data_file(SEED_DATA_DIR, 'categories')), 'category')
+        items = resolve_categories(iter_records(find_data_file(SEED_DATA_DIR, 'menu_items')),
+                                   category_id_map(Category))
+        bulk_create_missing(MenuItem, 'name', items, 'menu item')
+        bulk_create_missing(Promotion, 'title', iter_records(find_data_file(SEED_DATA_DIR, 'promotions')),
+                            'promotion')
+    seed_titles = list(Promotion.objects.values_list('title', flat=True))
+
+    work_dir = tempfile.mkdtemp(prefix='tokyo-bench-writer-')
+    previous_base = image_base_url()
+    previous_cache = os.environ.get('TOKYO_IMAGE_CACHE')
+    writer.PRICING_OUTPUT = os.path.join(work_dir, 'promotion-pricing.json')
+
+    def setup():
+        # Rasmlar, yangi aksiyalar va kesh har safar tozalanadi
+        MenuItem.objects.update(image='')
+        Promotion.objects.update(image='')
+        Promotion.objects.exclude(title__in=seed_titles).delete()
+        shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
+        shutil.rmtree(os.path.join(work_dir, 'images'), ignore_errors=True)
+
+    def run_writer():
+        with contextlib.redirect_stdout(io.StringIO()):
+            writer.add_images_and_promotions()
+
+    try:
+        os.environ['TOKYO_IMAGE_CACHE'] = os.path.join(work_dir, 'images')
+        with FakeTokyoServer(('127.0.0.1', 0), latency=WRITER_LATENCY) as server:
+            set_image_base_url(server.base_url)
+            setup()
+            with RunProfile('bench') as profile:
+                run_writer()
+            queries = sum(phase['queries'] for phase in profile.phases.values())
+            durations = measure(run_writer, repeat, setup=setup)
+            downloads = server.stats['images']
+    finally:
+        set_image_base_url(previous_base)
+        if previous_cache is None:
+            os.environ.pop('TOKYO_IMAGE_CACHE', None)
+        else:
+            os.environ['TOKYO_IMAGE_CACHE'] = previous_cache
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return result(GROUP, 'add_images_promotions.writer', durations,
+                  extra={'queries': queries, 'downloads': downloads}, latency=WRITER_LATENCY)
@@ -0,0 +1,35 @@
+"""
+Timing helpers shared by the benchmark modules
+"""
+import statistics
+import time
+
+
+def measure(func, repeat=3, setup=None):
+    """Run func `repeat` times (after setup(), if given) and return the durations in seconds"""
+    durations = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def result(group, name, durations, extra=None, **params):
+    """
+    One benchmark result entry. `params` identify the case (they are part
+    of its id); `extra` holds other measurements, e.g. query counts.
+    """
+    entry = {
+        'id': f"{group}.{name}" + "".join(f"[{key}={value}]" for key, value in sorted(params.items())),
+        'group': group,
+        'name': name,
+        'params': params,
+        'median': round(statistics.median(durations), 6),
+        'min': round(min(durations), 6),
+        'runs': len(durations),
+    }
+    entry.update(extra or {})
+    return entry
@@ -0,0 +1,48 @@
+"""
+Synthetic data for the benchmarks: catalog rows and logo images (the
+image hosts are stood in for by scripts/fake_server.py)
+"""
+import math
+import os
+import random
+
+from PIL import Image, ImageDraw
+
+from scripts.seed_loader import iter_records
+
+SEED_ITEMS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'seed_data', 'tokyo', 'menu_items.jsonl')
+
+
+def synthetic_catalog(count, category_ids, seed=0):
+    """
+    `count` menu item rows shaped like seed_data/tokyo/menu_items.jsonl,
+    with unique names and varied prices, spread over category_ids.
+    """
+    rng = random.Random(seed)
+    templates = list(iter_records(SEED_ITEMS))
+    for template in templates:
+        template.pop('category', None)
+    for index in range(count):
+        row = dict(templates[index % len(templates)])
+        suffix = f" #{index}"
+        for field in ('name', 'name_uz', 'name_ru'):
+            row[field] = f"{row[field]}{suffix}"
+        row['price'] = f"{rng.randrange(10, 200) * 1000}.00"
+        row['rating'] = round(rng.uniform(3.5, 5.0), 1)
+        row['category_id'] = category_ids[index % len(category_ids)]
+        yield row
+
+
+def logo_image(megapixels):
+    """A 4:3 screenshot-like image: light background, green circle, red logo mark"""
+    width = int(math.sqrt(megapixels * 1_000_000 * 4 / 3))
+    height = int(width * 3 / 4)
+    img = Image.new('RGB', (width, height), (245, 245, 240))
+    draw = ImageDraw.Draw(img)
+    radius = min(width, height) // 4
+    cx, cy = width // 2, height // 2
+    draw.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), fill=(40, 170, 60))
+    inner = radius // 2
+    draw.rectangle((cx - inner, cy - inner // 2, cx + inner, cy + inner // 2), fill=(210, 30, 40))
+    return img
@@ -0,0 +1,117 @@
+"""
+Run the offline benchmark suite and save the results as JSON
+
+Usage:
+    python -m benchmarks.run --out results.json
+    python -m benchmarks.run --only seed --sizes 100,10000 --backend-dir ../backend
+    python -m benchmarks.run --only logos --compare results.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+# Skriptlar "scripts." orqali import qilinadi, shuning uchun repo ildizi yo'lda bo'lishi kerak
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks import bench_images, bench_logos, bench_seed
+
+RESULTS_VERSION = 1
+GROUPS = ('seed', 'images', 'logos')
+DEFAULT_REPEAT = 3
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _int_list(value):
+    return tuple(int(float(part)) for part in value.split(',') if part)
+
+
+def compare(results, previous_path):
+    """Print the median of each benchmark next to the same benchmark in previous_path"""
+    with open(previous_path, encoding='utf-8') as f:
+        previous = {entry['id']: entry for entry in json.load(f)['results']}
+    print(f"\nvs {previous_path}:")
+    for entry in results:
+        old = previous.get(entry['id'])
+        if old is None:
+            continue
+        ratio = entry['median'] / old['median'] if old['median'] else float('inf')
+        marker = '🟢' if ratio < 0.95 else '🔴' if ratio > 1.05 else '⚪'
+        print(f"  {marker} {entry['id']}: {old['median']:.4f}s -> {entry['median']:.4f}s ({ratio:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the data, image and logo tooling")
+    parser.add_argument('--only', default=','.join(GROUPS), help=f"Comma separated groups ({', '.join(GROUPS)})")
+    parser.add_argument('--out', default=None, help="Write results JSON to this file")
+    parser.add_argument('--compare', default=None, help="Previous results JSON to compare medians against")
+    parser.add_argument('--repeat', type=int, default=None,
+                        help=f"Runs per benchmark (default {DEFAULT_REPEAT}; seed group: 1)")
+    parser.add_argument('--sizes', type=_int_list, default=bench_seed.DEFAULT_SIZES,
+                        help="Catalog sizes for the seed group, e.g. 100,10000,100000")
+    parser.add_argument('--megapixels', type=_int_list, default=bench_logos.DEFAULT_MEGAPIXELS,
+                        help="Image sizes for the logo group, e.g. 1,4,12")
+    parser.add_argument('--latency', type=float, default=bench_images.DEFAULT_LATENCY,
+                        help="Fixture server latency per request in seconds")
+    parser.add_argument('--backend-dir', default=None,
+                        help="Directory containing the backend's `menu` app (default: $TOKYO_BACKEND_DIR)")
+    args = parser.parse_args()
+
+    groups = [group for group in args.only.split(',') if group]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown groups: {', '.join(sorted(unknown))}")
+
+    results = []
+    skipped = {}
+    for group in groups:
+        print(f"⏱️  {group}...", flush=True)
+        try:
+            if group == 'seed':
+                entries = bench_seed.run(args.sizes, args.repeat or 1, args.backend_dir)
+            elif group == 'images':
+                entries = bench_images.run(latency=args.latency, repeat=args.repeat or DEFAULT_REPEAT)
+            else:
+                entries = bench_logos.run(args.megapixels, args.repeat or DEFAULT_REPEAT)
+        except ImportError as e:
+            # Masalan, backend (menu ilovasi) topilmasa
+            print(f"⏭️  {group} skipped: {e}")
+            skipped[group] = str(e)
+            continue
+        for entry in entries:
+            extra = f" ({entry['queries']} queries)" if 'queries' in entry else ""
+            print(f"  {entry['id']}: {entry['median']:.4f}s{extra}")
+        results += entries
+
+    report = {
+        'version': RESULTS_VERSION,
+        'commit': _git_commit(),
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'skipped': skipped,
+        'results': results,
+    }
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 {len(results)} results -> {args.out}")
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+import os
+import argparse
+import django
+from django.conf import settings
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'restaurant_api.settings')
+django.setup()
+
+from menu.models import MenuItem, Promotion
+from scripts.image_derivatives import output_formats
+from scripts.media_utils import save_derivatives
+
+def build_image_derivatives():
+    """Create missing WebP/AVIF derivatives for every menu item and promotion image
+    (also covers images uploaded through the API by scripts/add_images_via_api.py)"""
+    print(f"🖼️ Building image derivatives ({', '.join(output_formats())})...")
+
+    created = 0
+    seen = set()
+    for model in (MenuItem, Promotion):
+        for obj in model.objects.exclude(image='').exclude(image__isnull=True).only('id', 'image'):
+            # Bir xil fayl bir necha obyektda bo'lishi mumkin
+            if obj.image.name in seen:
+                continue
+            seen.add(obj.image.name)
+            try:
+                with obj.image.open('rb') as f:
+                    content = f.read()
+                names = save_derivatives(obj.image.storage, content)
+                created += len(names)
+                if names:
+                    print(f"✅ {obj.image.name}: {len(names)} derivatives")
+            except Exception as e:
+                print(f"❌ Error processing {obj.image.name}: {e}")
+
+    print(f"🎉 Done: {created} derivatives created for {len(seen)} images")
+
+if __name__ == '__main__':
+    argparse.ArgumentParser(description="Build responsive image derivatives").parse_args()
+    build_image_derivatives()
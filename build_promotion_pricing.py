@@ -0,0 +1,25 @@
+import os
+import argparse
+import django
+from django.conf import settings
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'restaurant_api.settings')
+django.setup()
+
+from menu.models import MenuItem, Promotion
+from scripts.promotion_pricing import DEFAULT_OUTPUT, refresh_pricing_file
+
+def build_promotion_pricing(output_path=DEFAULT_OUTPUT, force=False):
+    """Materialize effective prices for every (promotion, menu item) pair.
+    Run it from cron (e.g. hourly) so promotions that started or ended are picked up."""
+    if refresh_pricing_file(Promotion, MenuItem, output_path, force=force):
+        print(f"✅ Promotion pricing table written to {output_path}")
+    else:
+        print(f"⏭️  Promotion pricing table is up to date ({output_path})")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the materialized promotion pricing table")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Output file (default: public/promotion-pricing.json)")
+    parser.add_argument('--force', action='store_true', help="Rebuild even if nothing changed")
+    args = parser.parse_args()
+    build_promotion_pricing(args.output, args.force)
@@ -0,0 +1,30 @@
+import os
+import argparse
+import django
+from django.conf import settings
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'restaurant_api.settings')
+django.setup()
+
+from menu.models import MenuItem
+from scripts.search_index import LIST_FIELDS, TEXT_FIELDS, build_search_index, dump_search_index
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'public', 'search-index.json')
+
+def build_index_file(output_path=DEFAULT_OUTPUT):
+    """Compile the multilingual search index of all menu items into a static JSON file"""
+    print("🔎 Building search index...")
+
+    # Faqat kerakli ustunlar bitta so'rov bilan o'qiladi
+    items = MenuItem.objects.order_by('id').values('id', 'category_id', *TEXT_FIELDS, *LIST_FIELDS).iterator()
+    index = build_search_index(items)
+    size = dump_search_index(index, output_path)
+
+    print(f"🎉 Done: {len(index['items'])} items, {len(index['prefixes'])} prefixes, "
+          f"{size / 1024:.1f} KB -> {output_path}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the static multilingual search index")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Output file (default: public/search-index.json)")
+    args = parser.parse_args()
+    build_index_file(args.output)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 from PIL import Image
 
+from scripts.logo_tools import remove_green_background
+
 def create_logo_with_original_size():
     """Create a logo with the same dimensions as the original green circle"""
     image_path = "/Users/ogabek/Downloads/restaurantmenusystem3-5/image.png"
@@ -31,29 +33,12 @@ def create_logo_with_original_size():
     
     print(f"Estimated circle dimensions: {estimated_circle_size}x{estimated_circle_size}")
     
-    # Create a new transparent image with the exact same dimensions as the green circle
-    new_logo = Image.new('RGBA', (estimated_circle_size, estimated_circle_size), (0, 0, 0, 0))
-    
     # Extract the logo area from the original image
+    # (areas outside the image come back fully transparent)
     logo_area = img.crop(circle_bbox)
     
-    # Process each pixel to remove green background
-    for x in range(estimated_circle_size):
-        for y in range(estimated_circle_size):
-            try:
-                r, g, b, a = logo_area.getpixel((x, y))
-                
-                # Check if this pixel is part of the green background
-                # Green background typically has high green values
-                if g > r and g > b and g > 120:
-                    # Make transparent
-                    new_logo.putpixel((x, y), (0, 0, 0, 0))
-                else:
-                    # Keep the original pixel
-                    new_logo.putpixel((x, y), (r, g, b, a))
-            except:
-                # Handle any edge cases
-                new_logo.putpixel((x, y), (0, 0, 0, 0))
+    # Remove green background (green background typically has high green values)
+    new_logo = remove_green_background(logo_area, threshold=120)
     
     # Save the new logo
     new_logo.save(output_path, 'PNG')
@@ -1,30 +1,14 @@
 #!/usr/bin/env python3
 from PIL import Image
-import numpy as np
+
+from scripts.logo_tools import find_color_bboxes, tolerance_range
 
 def find_color_region_bbox(image_path, target_color_rgb, tolerance=40):
     """
     Finds the bounding box of a region in an image that closely matches a target color.
     """
-    img = Image.open(image_path).convert('RGB')
-    data = np.array(img)
-
-    # Create a mask for pixels close to the target color
-    mask = (np.abs(data[:, :, 0] - target_color_rgb[0]) < tolerance) & \
-           (np.abs(data[:, :, 1] - target_color_rgb[1]) < tolerance) & \
-           (np.abs(data[:, :, 2] - target_color_rgb[2]) < tolerance)
-
-    # Find the bounding box of the masked pixels
-    rows = np.any(mask, axis=1)
-    cols = np.any(mask, axis=0)
-    
-    if not np.any(rows) or not np.any(cols):
-        return None # No pixels of target color found
-
-    ymin, ymax = np.where(rows)[0][[0, -1]]
-    xmin, xmax = np.where(cols)[0][[0, -1]]
-
-    return (xmin, ymin, xmax, ymax)
+    img = Image.open(image_path)
+    return find_color_bboxes(img, [tolerance_range(target_color_rgb, tolerance)])[0]
 
 def create_resized_transparent_logo(original_screenshot_path, output_logo_path):
     """
@@ -38,8 +22,12 @@ def create_resized_transparent_logo(original_screenshot_path, output_logo_path):
     green_color = (102, 187, 106) 
     red_color = (239, 83, 80) 
 
-    # 2. Find the bounding box of the green circle (this will be our new canvas size)
-    green_bbox = find_color_region_bbox(original_screenshot_path, green_color, tolerance=40)
+    # 2. Find the bounding boxes of the green circle (this will be our new canvas size)
+    #    and of the red logo in a single pass over the image
+    green_bbox, red_bbox_original = find_color_bboxes(screenshot, [
+        tolerance_range(green_color, 40),
+        tolerance_range(red_color, 40),
+    ])
     
     if not green_bbox:
         print("Could not find green circle in the original image. Please ensure the image contains the green circle.")
@@ -50,9 +38,7 @@ def create_resized_transparent_logo(original_screenshot_path, output_logo_path):
     green_circle_height = green_bbox[3] - green_bbox[1]
     print(f"Desired canvas dimensions (from green circle): {green_circle_width}x{green_circle_height}")
 
-    # 3. Find the bounding box of the red logo (the content we want to extract)
-    red_bbox_original = find_color_region_bbox(original_screenshot_path, red_color, tolerance=40)
-    
+    # 3. Check the bounding box of the red logo (the content we want to extract)
     if not red_bbox_original:
         print("Could not find red logo in the original image. Please ensure the image contains the red logo.")
         return
@@ -78,10 +64,11 @@ def create_resized_transparent_logo(original_screenshot_path, output_logo_path):
     new_logo_canvas.save(output_logo_path)
     print(f"New transparent logo saved to {output_logo_path}")
 
-# Define paths
-original_screenshot_path = "/Users/ogabek/Downloads/restaurantmenusystem3-5/image.png"
-output_logo_path = "/Users/ogabek/Downloads/restaurantmenusystem3-5/frontend/public/logo.png"
+if __name__ == "__main__":
+    # Define paths
+    original_screenshot_path = "/Users/ogabek/Downloads/restaurantmenusystem3-5/image.png"
+    output_logo_path = "/Users/ogabek/Downloads/restaurantmenusystem3-5/frontend/public/logo.png"
 
-# Execute the function
-create_resized_transparent_logo(original_screenshot_path, output_logo_path)
+    # Execute the function
+    create_resized_transparent_logo(original_screenshot_path, output_logo_path)
 
@@ -1,58 +1,31 @@
 #!/usr/bin/env python3
 from PIL import Image
-import numpy as np
 
-def analyze_image_colors(image_path):
-    """Analyze the image to find the most common colors"""
-    img = Image.open(image_path).convert('RGB')
-    data = np.array(img)
-    
-    # Reshape to list of pixels
-    pixels = data.reshape(-1, 3)
-    
-    # Find unique colors and their counts
-    unique_colors, counts = np.unique(pixels.view(np.void, pixels.dtype.itemsize * pixels.shape[1]), return_counts=True)
-    
-    # Convert back to RGB format
-    unique_colors = unique_colors.view(pixels.dtype).reshape(-1, 3)
+from scripts.logo_tools import dominant_colors, find_color_bboxes, remove_green_background
+
+def analyze_image_colors(image_path, top_k=20, quantize_bits=8, max_pixels=None):
+    """
+    Analyze the image to find the most common colors (returns the top_k colors).
+
+    Counts are exact by default; quantize_bits < 8 merges near shades and
+    max_pixels samples large images first (faster, approximate).
+    """
+    img = Image.open(image_path)
     
-    # Sort by frequency
-    sorted_indices = np.argsort(counts)[::-1]
+    colors, counts = dominant_colors(img, top_k=top_k, quantize_bits=quantize_bits, max_pixels=max_pixels)
     
     print("Top 10 most common colors:")
-    for i in range(min(10, len(unique_colors))):
-        idx = sorted_indices[i]
-        color = unique_colors[idx]
-        count = counts[idx]
+    for color, count in list(zip(colors, counts))[:10]:
         print(f"RGB({color[0]:3d}, {color[1]:3d}, {color[2]:3d}) - {count:6d} pixels")
     
-    return unique_colors[sorted_indices]
+    return colors
 
 def find_region_by_color_range(img, min_rgb, max_rgb):
     """Find regions that fall within a color range"""
-    data = np.array(img)
-    
-    # Create mask for pixels within the color range
-    mask = (data[:, :, 0] >= min_rgb[0]) & (data[:, :, 0] <= max_rgb[0]) & \
-           (data[:, :, 1] >= min_rgb[1]) & (data[:, :, 1] <= max_rgb[1]) & \
-           (data[:, :, 2] >= min_rgb[2]) & (data[:, :, 2] <= max_rgb[2])
-    
-    # Find bounding box
-    rows = np.any(mask, axis=1)
-    cols = np.any(mask, axis=0)
-    
-    if not np.any(rows) or not np.any(cols):
-        return None
-    
-    ymin, ymax = np.where(rows)[0][[0, -1]]
-    xmin, xmax = np.where(cols)[0][[0, -1]]
-    
-    return (xmin, ymin, xmax, ymax)
+    return find_color_bboxes(img, [(min_rgb, max_rgb)])[0]
 
-def create_logo_with_exact_size():
-    image_path = "/Users/ogabek/Downloads/restaurantmenusystem3-5/image.png"
-    output_path = "/Users/ogabek/Downloads/restaurantmenusystem3-5/frontend/public/logo.png"
-    
+def create_logo_with_exact_size(image_path="/Users/ogabek/Downloads/restaurantmenusystem3-5/image.png",
+                                output_path="/Users/ogabek/Downloads/restaurantmenusystem3-5/frontend/public/logo.png"):
     print("Analyzing image colors...")
     top_colors = analyze_image_colors(image_path)
     
@@ -70,18 +43,16 @@ def create_logo_with_exact_size():
     
     print(f"Found {len(green_candidates)} potential green colors")
     
-    green_bbox = None
+    # Create a range around each green color (int() avoids uint8 wrap-around)
+    tolerance = 30
+    green_ranges = []
     for green_color in green_candidates:
-        # Create a range around this green color
-        tolerance = 30
-        min_green = (max(0, green_color[0] - tolerance), 
-                    max(0, green_color[1] - tolerance), 
-                    max(0, green_color[2] - tolerance))
-        max_green = (min(255, green_color[0] + tolerance), 
-                    min(255, green_color[1] + tolerance), 
-                    min(255, green_color[2] + tolerance))
-        
-        bbox = find_region_by_color_range(img, min_green, max_green)
+        green_ranges.append((tuple(max(0, int(c) - tolerance) for c in green_color),
+                             tuple(min(255, int(c) + tolerance) for c in green_color)))
+    
+    # All candidate ranges are checked in a single pass over the image
+    green_bbox = None
+    for bbox in find_color_bboxes(img, green_ranges):
         if bbox:
             bbox_area = (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
             # Look for the largest green region (likely the background circle)
@@ -103,24 +74,9 @@ def create_logo_with_exact_size():
     
     print(f"Using dimensions: {circle_width}x{circle_height}")
     
-    # Create a new transparent image with the exact same dimensions as the green circle
-    new_logo = Image.new('RGBA', (circle_width, circle_height), (0, 0, 0, 0))
-    
-    # Crop the logo area from the original image (remove green background)
+    # Crop the logo area from the original image and remove the green background
     logo_area = img.crop(green_bbox)
-    
-    # Process each pixel to remove green background
-    for x in range(circle_width):
-        for y in range(circle_height):
-            r, g, b, a = logo_area.getpixel((x, y))
-            
-            # Check if this pixel is part of the green background
-            if g > r and g > b and g > 100:  # Green is dominant
-                # Make transparent
-                new_logo.putpixel((x, y), (0, 0, 0, 0))
-            else:
-                # Keep the original pixel
-                new_logo.putpixel((x, y), (r, g, b, a))
+    new_logo = remove_green_background(logo_area, threshold=100)
     
     # Save the new logo
     new_logo.save(output_path, 'PNG')
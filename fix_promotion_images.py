@@ -1,4 +1,5 @@
 import os
+import argparse
 import django
 from django.conf import settings
 
@@ -6,12 +7,14 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'restaurant_api.settings')
 django.setup()
 
 from menu.models import Promotion
-from django.core.files import File
-import requests
-from io import BytesIO
+from scripts.image_cache import ImageCache
+from scripts.http_client import set_image_base_url
+from scripts.image_fetch import DEFAULT_WORKERS, fetch_images
+from scripts.media_utils import save_image_download
+from scripts.run_plan import RunPlan
 
-def fix_promotion_images():
-    print("🖼️ Adding images to promotions...")
+def fix_promotion_images(workers=DEFAULT_WORKERS, plan=False):
+    print("🖼️ Planning promotion images..." if plan else "🖼️ Adding images to promotions...")
     
     # Yangi aksiyalar uchun rasmlar qo'shish
     promotion_images = {
@@ -21,27 +24,46 @@ def fix_promotion_images():
         'Weekend Special': 'https://images.unsplash.com/photo-1579584425555-c3ce17fd4351?w=400&h=300&fit=crop'
     }
 
+    promos = {promo.title: promo for promo in Promotion.objects.filter(title__in=promotion_images)}
+
+    jobs = []
     for promo_name, image_url in promotion_images.items():
-        try:
-            promo = Promotion.objects.get(title=promo_name)
-            if not promo.image:
-                response = requests.get(image_url, timeout=10)
-                if response.status_code == 200:
-                    image_file = BytesIO(response.content)
-                    filename = f"{promo_name.lower().replace(' ', '_')}.jpg"
-                    promo.image.save(filename, File(image_file), save=True)
-                    print(f"✅ Added image for promotion: {promo_name}")
-                else:
-                    print(f"❌ Failed to download image for promotion: {promo_name}")
-            else:
-                print(f"⏭️  Promotion {promo_name} already has an image")
-        except Promotion.DoesNotExist:
+        promo = promos.get(promo_name)
+        if promo is None:
             print(f"❌ Promotion {promo_name} not found")
+        elif promo.image:
+            print(f"⏭️  Promotion {promo_name} already has an image")
+        else:
+            jobs.append((promo_name, image_url))
+
+    if plan:
+        run_plan = RunPlan("fix_promotion_images")
+        run_plan.add_images('promotion images', jobs, cache=ImageCache(), workers=workers)
+        run_plan.report()
+        return run_plan
+
+    for promo_name, download, error in fetch_images(jobs, workers=workers, cache=ImageCache()):
+        if error is not None:
+            print(f"❌ Failed to download image for promotion: {promo_name} ({error})")
+            continue
+        try:
+            save_image_download(promos[promo_name], download)
+            print(f"✅ Added image for promotion: {promo_name}")
         except Exception as e:
             print(f"❌ Error adding image for promotion {promo_name}: {e}")
 
     print("🎉 Promotion images added successfully!")
 
 if __name__ == '__main__':
-    fix_promotion_images()
-
+    parser = argparse.ArgumentParser(description="Add images to promotions")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help="Number of concurrent image downloads")
+    parser.add_argument('--plan', action='store_true',
+                        help="Only report pending downloads, transfer volume and queries (no writes)")
+    parser.add_argument('--image-base-url', default=None,
+                        help="Fetch images from this server instead of the real hosts "
+                             "(default: $TOKYO_IMAGE_BASE_URL), e.g. scripts/fake_server.py")
+    args = parser.parse_args()
+    if args.image_base_url:
+        set_image_base_url(args.image_base_url)
+    fix_promotion_images(args.workers, plan=args.plan)
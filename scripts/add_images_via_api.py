@@ -1,177 +1,273 @@
 """
 Script to add images to products via API (can run locally)
-Usage: python scripts/add_images_via_api.py
+Usage: python scripts/add_images_via_api.py [--api-rps 5] [--image-rps 10]
+                                            [--resolve-workers 4] [--download-workers 4] [--upload-workers 2]
+                                            [--resolve-deadline 6]
+                                            [--api-url URL] [--image-base-url URL]
+
+Offline run against the local stand-in server (scripts/fake_server.py):
+    python scripts/add_images_via_api.py --api-url http://127.0.0.1:8765/api --image-base-url http://localhost:8765
 """
+import argparse
 import requests
-import time
 import sys
 import os
+from urllib.parse import urlsplit
 
 # Add parent directory to path to import from lib
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-API_URL = "https://api.tokyokafe.uz/api"  # Production API
-# API_URL = "http://localhost:8000/api"  # Local API (if running locally)
+from scripts import food_terms
+from scripts.checkpoint import CheckpointJournal
+from scripts.downloads import stream_download
+from scripts.image_cache import ImageCache
+from scripts.pipeline import DEFAULT_QUEUE_SIZE, run_pipeline
+from scripts.http_client import (DEFAULT_RETRIES as HTTP_RETRIES, get_session, image_base_url, image_host_url,
+                                 set_image_base_url)
+from scripts.image_sources import ImageSourceRegistry, SourceUnavailable
+from scripts.rate_limit import RETRY_STATUSES, HostRateLimiter
+from scripts.resolve_cache import TTLCache
+
+PRODUCTION_API_URL = "https://api.tokyokafe.uz/api"
+# TOKYO_API_URL=http://localhost:8000/api  # Local API (if running locally)
+API_URL = os.environ.get('TOKYO_API_URL') or PRODUCTION_API_URL
+
+# Bir xil rasm faqat bir marta yuklab olinadi (barcha skriptlar uchun umumiy kesh)
+image_cache = ImageCache()
+
+
+def resolve_cache_path():
+    """Stand-in image hosts get their own resolve cache (their URLs must not reach production)"""
+    if not image_base_url():
+        return None
+    host = urlsplit(image_base_url()).netloc.replace(':', '_')
+    return os.path.join(os.path.expanduser('~'), '.cache', 'tokyo', f"resolve.{host}.json")
+
+
+# Qidiruv so'zi -> rasm URL keshi (ishga tushirishlar orasida saqlanadi)
+resolve_cache = TTLCache(resolve_cache_path())
+TERM_CACHE_TTL = 7 * 24 * 3600  # 7 kun
+SOURCE_FAILURE_TTL = 3600  # ishlamagan manba 1 soat davomida so'ralmaydi
+DEFAULT_RESOLVE_DEADLINE = 6  # barcha manbalar uchun umumiy kutish vaqti (soniya)
+
+# So'rovlar tezligi: API va rasm manbalari uchun alohida limit (so'rov/soniya)
+DEFAULT_API_RPS = 5
+DEFAULT_IMAGE_RPS = 10
+
+# Katalog sahifalab olinadi
+MENU_PAGE_SIZE = 100
+
+# Har bir bosqich uchun parallel oqimlar soni
+DEFAULT_RESOLVE_WORKERS = 4
+DEFAULT_DOWNLOAD_WORKERS = 4
+DEFAULT_UPLOAD_WORKERS = 2
+rate_limiter = HostRateLimiter(default_rps=DEFAULT_IMAGE_RPS,
+                               host_rps={urlsplit(API_URL).hostname: DEFAULT_API_RPS})
+
+
+def configure_rate_limits(api_rps, image_rps):
+    """Set requests-per-second budgets for the API host and image hosts"""
+    global rate_limiter
+    rate_limiter = HostRateLimiter(default_rps=image_rps,
+                                   host_rps={urlsplit(API_URL).hostname: api_rps})
 
 
-def get_menu_items():
-    """Get all menu items from API"""
+def configure_endpoints(api_url=None, base_url=None):
+    """Point the script at another API and/or image host base URL (e.g. scripts/fake_server.py)"""
+    global API_URL, resolve_cache
+    if api_url:
+        API_URL = api_url.rstrip('/')
+    if base_url:
+        set_image_base_url(base_url)
+        resolve_cache = TTLCache(resolve_cache_path())
+        image_sources.failure_cache = resolve_cache
+
+
+def _rewind_files(kwargs):
+    """Multipart file objects are read again on every attempt"""
+    for value in (kwargs.get('files') or {}).values():
+        data = value[1] if isinstance(value, tuple) else value
+        if hasattr(data, 'seek'):
+            data.seek(0)
+
+
+def limited_request(method, url, **kwargs):
+    """
+    Send a request within the host's rate budget and adapt it to the response.
+
+    429/5xx are retried here, not inside urllib3, so every attempt waits
+    for the limiter and reports its status back to it.
+    """
+    for attempt in range(HTTP_RETRIES + 1):
+        rate_limiter.wait(url)
+        if attempt:
+            _rewind_files(kwargs)
+        try:
+            response = get_session(status_retries=False).request(method, url, **kwargs)
+        except requests.RequestException:
+            rate_limiter.feedback(url, 503)
+            raise
+        rate_limiter.feedback(url, response.status_code, response.headers.get('Retry-After'))
+        if response.status_code not in RETRY_STATUSES:
+            break
+    return response
+
+
+def fetch_page(url):
+    """GET one page of the catalog (transient failures are retried by limited_request)"""
     try:
-        response = requests.get(f"{API_URL}/menu-items/?show_all=true", timeout=30)
+        response = limited_request('GET', url, timeout=30)
         if response.status_code == 200:
             return response.json()
-        else:
-            print(f"Error fetching menu items: {response.status_code}")
-            return []
-    except Exception as e:
-        print(f"Error: {e}")
-        return []
+        error = f"HTTP {response.status_code}"
+    except (requests.RequestException, ValueError) as e:
+        error = e
+    raise RuntimeError(f"Error fetching menu items from {url}: {error}")
+
+
+def get_menu_items(page_size=MENU_PAGE_SIZE):
+    """
+    Yield menu items from the API page by page.
+
+    Follows the `next` links of a paginated response; if the API returns a
+    plain list (pagination disabled), its items are yielded as they are.
+    """
+    url = f"{API_URL}/menu-items/?show_all=true&page=1&page_size={page_size}"
+    while url:
+        data = fetch_page(url)
+        if isinstance(data, list):
+            yield from data
+            return
+        yield from data.get('results', [])
+        url = data.get('next')
 
 
 def translate_to_english(uzbek_term):
-    """Simple translation mapping for common Uzbek food terms"""
-    translations = {
-        'pitsa': 'pizza',
-        'pizza': 'pizza',
-        'shashlik': 'kebab',
-        'kebab': 'kebab',
-        'steyk': 'steak',
-        'steak': 'steak',
-        'tovuq': 'chicken',
-        'chicken': 'chicken',
-        'pasta': 'pasta',
-        'salat': 'salad',
-        'salatlar': 'salad',
-        'soup': 'soup',
-        'sho\'rva': 'soup',
-        'soup': 'soup',
-        'desert': 'dessert',
-        'desertlar': 'dessert',
-        'ichimlik': 'drink',
-        'drink': 'drink',
-        'sushi': 'sushi',
-        'ramen': 'ramen',
-        'lagmon': 'noodles',
-        'non': 'bread',
-        'bread': 'bread',
-        'katta': 'large',
-        'kichik': 'small',
-        'o\'rta': 'medium',
-        'juda': 'very',
-        'adana': 'adana',
-        'bon': 'filet',
-        'file': 'filet',
-        'qanotlari': 'wings',
-        'wings': 'wings',
-        'lososli': 'salmon',
-        'salmon': 'salmon',
-        'qaymoqli': 'cream',
-        'cream': 'cream',
-        'pishloqli': 'cheese',
-        'cheese': 'cheese',
-        'vafl': 'waffle',
-        'waffle': 'waffle',
-        'katlet': 'cutlet',
-        'cutlet': 'cutlet',
-        'bog\'ir': 'lamb',
-        'mol': 'beef',
-        'go\'shti': 'meat',
-    }
-    
-    words = uzbek_term.lower().split('+')
-    translated = []
-    for word in words:
-        # Remove special characters
-        clean_word = word.strip().replace("'", "").replace("(", "").replace(")", "")
-        if clean_word in translations:
-            translated.append(translations[clean_word])
-        elif len(clean_word) > 2:
-            translated.append(clean_word)
-    
-    return '+'.join(translated[:3]) if translated else 'food'
+    """Translate common Uzbek / Russian food terms (see scripts/food_terms.py)"""
+    return food_terms.to_english(uzbek_term) or 'food'
 
 
 def get_image_url(search_term):
-    """Get image URL from multiple sources"""
+    """Get image URL from multiple sources (memoized per English term)"""
     # First, translate to English
     english_term = translate_to_english(search_term)
     
-    # Try Foodish API first (free, no key needed, returns random food images)
-    try:
-        foodish_url = "https://foodish-api.herokuapp.com/images/"
-        foodish_response = requests.get(foodish_url, timeout=5)
-        if foodish_response.status_code == 200:
-            data = foodish_response.json()
-            if 'image' in data:
-                return data['image']
-    except Exception as e:
-        pass
-    
-    # Try Unsplash Source with English term
-    try:
-        url = f"https://source.unsplash.com/800x800/?food,{english_term}"
-        response = requests.head(url, allow_redirects=True, timeout=10)
-        if response.status_code == 200:
-            final_url = response.url
-            if 'unsplash.com' in final_url and 'images.unsplash.com' in final_url:
-                return final_url
-    except Exception as e:
-        pass
-    
-    # Try direct Unsplash image URLs based on food category
-    food_images = {
-        'pizza': 'https://images.unsplash.com/photo-1513104890138-7c749659a591?w=800&h=800&fit=crop',
-        'kebab': 'https://images.unsplash.com/photo-1534939561126-855b8675edd7?w=800&h=800&fit=crop',
-        'steak': 'https://images.unsplash.com/photo-1546833999-b9f581a1996d?w=800&h=800&fit=crop',
-        'chicken': 'https://images.unsplash.com/photo-1604503468506-a8da13d82791?w=800&h=800&fit=crop',
-        'pasta': 'https://images.unsplash.com/photo-1551183053-bf91a1d81141?w=800&h=800&fit=crop',
-        'salad': 'https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=800&h=800&fit=crop',
-        'soup': 'https://images.unsplash.com/photo-1547592166-23ac45744acd?w=800&h=800&fit=crop',
-        'dessert': 'https://images.unsplash.com/photo-1551024506-0bccd828d307?w=800&h=800&fit=crop',
-        'drink': 'https://images.unsplash.com/photo-1544145945-f90425340c7e?w=800&h=800&fit=crop',
-        'sushi': 'https://images.unsplash.com/photo-1579584425555-c3ce17fd4351?w=800&h=800&fit=crop',
-        'ramen': 'https://images.unsplash.com/photo-1569718212165-3a8278d5f624?w=800&h=800&fit=crop',
-        'noodles': 'https://images.unsplash.com/photo-1569718212165-3a8278d5f624?w=800&h=800&fit=crop',
-        'bread': 'https://images.unsplash.com/photo-1509440159596-0249088772ff?w=800&h=800&fit=crop',
-        'waffle': 'https://images.unsplash.com/photo-1562376552-0d160a2f238d?w=800&h=800&fit=crop',
-        'cutlet': 'https://images.unsplash.com/photo-1604503468506-a8da13d82791?w=800&h=800&fit=crop',
-        'lamb': 'https://images.unsplash.com/photo-1534939561126-855b8675edd7?w=800&h=800&fit=crop',
-        'beef': 'https://images.unsplash.com/photo-1546833999-b9f581a1996d?w=800&h=800&fit=crop',
-        'salmon': 'https://images.unsplash.com/photo-1467003909585-2f8a72700288?w=800&h=800&fit=crop',
-    }
+    cache_key = f"term:{english_term}"
+    image_url = resolve_cache.get(cache_key, None)
+    if image_url:
+        return image_url
     
-    # Check if we have a specific image for this term
-    for key, url in food_images.items():
-        if key in english_term.lower():
-            return url
-    
-    # Fallback: Generic food image
-    return 'https://images.unsplash.com/photo-1546069901-ba9599a7e63c?w=800&h=800&fit=crop'
+    image_url, ttl = resolve_image_url(english_term)
+    resolve_cache.set(cache_key, image_url, ttl)
+    return image_url
+
+
+# Direct Unsplash image URLs based on food category (checked first, no I/O)
+FOOD_IMAGES = {
+    'pizza': 'https://images.unsplash.com/photo-1513104890138-7c749659a591?w=800&h=800&fit=crop',
+    'kebab': 'https://images.unsplash.com/photo-1534939561126-855b8675edd7?w=800&h=800&fit=crop',
+    'steak': 'https://images.unsplash.com/photo-1546833999-b9f581a1996d?w=800&h=800&fit=crop',
+    'chicken': 'https://images.unsplash.com/photo-1604503468506-a8da13d82791?w=800&h=800&fit=crop',
+    'pasta': 'https://images.unsplash.com/photo-1551183053-bf91a1d81141?w=800&h=800&fit=crop',
+    'salad': 'https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=800&h=800&fit=crop',
+    'soup': 'https://images.unsplash.com/photo-1547592166-23ac45744acd?w=800&h=800&fit=crop',
+    'dessert': 'https://images.unsplash.com/photo-1551024506-0bccd828d307?w=800&h=800&fit=crop',
+    'drink': 'https://images.unsplash.com/photo-1544145945-f90425340c7e?w=800&h=800&fit=crop',
+    'sushi': 'https://images.unsplash.com/photo-1579584425555-c3ce17fd4351?w=800&h=800&fit=crop',
+    'ramen': 'https://images.unsplash.com/photo-1569718212165-3a8278d5f624?w=800&h=800&fit=crop',
+    'noodles': 'https://images.unsplash.com/photo-1569718212165-3a8278d5f624?w=800&h=800&fit=crop',
+    'bread': 'https://images.unsplash.com/photo-1509440159596-0249088772ff?w=800&h=800&fit=crop',
+    'waffle': 'https://images.unsplash.com/photo-1562376552-0d160a2f238d?w=800&h=800&fit=crop',
+    'cutlet': 'https://images.unsplash.com/photo-1604503468506-a8da13d82791?w=800&h=800&fit=crop',
+    'lamb': 'https://images.unsplash.com/photo-1534939561126-855b8675edd7?w=800&h=800&fit=crop',
+    'beef': 'https://images.unsplash.com/photo-1546833999-b9f581a1996d?w=800&h=800&fit=crop',
+    'salmon': 'https://images.unsplash.com/photo-1467003909585-2f8a72700288?w=800&h=800&fit=crop',
+}
+
+# Fallback: Generic food image
+GENERIC_IMAGE_URL = 'https://images.unsplash.com/photo-1546069901-ba9599a7e63c?w=800&h=800&fit=crop'
+
+
+def static_food_image(english_term):
+    """Check if we have a specific image for this term"""
+    key = food_terms.image_key(english_term)
+    return FOOD_IMAGES[key] if key else None
+
+
+def foodish_image(english_term):
+    """Foodish API (free, no key needed, returns random food images)"""
+    response = limited_request('GET', image_host_url("https://foodish-api.herokuapp.com/images/"), timeout=5)
+    if response.status_code in RETRY_STATUSES:
+        raise SourceUnavailable(f"HTTP {response.status_code}")
+    if response.status_code == 200:
+        return response.json().get('image')
+    return None
+
+
+def unsplash_source_image(english_term):
+    """Unsplash Source with English term (the redirect target is the image)"""
+    url = image_host_url(f"https://source.unsplash.com/800x800/?food,{english_term}")
+    response = limited_request('HEAD', url, allow_redirects=True, timeout=10)
+    if response.status_code in RETRY_STATUSES:
+        raise SourceUnavailable(f"HTTP {response.status_code}")
+    if response.status_code == 200:
+        return response.url
+    return None
+
+
+image_sources = ImageSourceRegistry(deadline=DEFAULT_RESOLVE_DEADLINE, failure_cache=resolve_cache,
+                                    failure_ttl=SOURCE_FAILURE_TTL)
+image_sources.register('static', static_food_image, static=True)
+image_sources.register('foodish', foodish_image)
+image_sources.register('unsplash', unsplash_source_image,
+                       accept=lambda url: 'images.unsplash.com' in url)
+
+
+def resolve_image_url(english_term):
+    """
+    Resolve an image URL for an English term.
+
+    Returns (url, ttl): sources race in parallel (recently failed ones are
+    skipped); if none answers before the deadline, the generic image is
+    used and only remembered for a short time.
+    """
+    _, image_url = image_sources.resolve(english_term)
+    if image_url:
+        return image_url, TERM_CACHE_TTL
+    return GENERIC_IMAGE_URL, SOURCE_FAILURE_TTL
 
 
 def download_image(image_url):
-    """Download image from URL"""
+    """
+    Download image from URL (served from the shared cache when possible).
+
+    Returns a scripts.downloads.Download spooled to a temporary file, or None.
+    """
+    image_url = image_host_url(image_url)
+    cached = image_cache.open(image_url)
+    if cached is not None:
+        return cached
     try:
-        response = requests.get(image_url, timeout=15, stream=True)
-        if response.status_code == 200:
-            return response.content
+        download = stream_download(lambda url, **kwargs: limited_request('GET', url, **kwargs), image_url)
+        image_cache.put_download(image_url, download)
+        return download
     except Exception as e:
         print(f"  Warning: Error downloading image: {e}")
     return None
 
 
-def update_menu_item_image(item_id, image_data, filename):
-    """Update menu item image via API"""
+def update_menu_item_image(item_id, image_data, filename, content_type='image/jpeg'):
+    """Update menu item image via API (image_data: bytes or a binary file)"""
     try:
         # Use PATCH to update only the image field
         url = f"{API_URL}/menu-items/{item_id}/"
         
         # Prepare multipart form data
         files = {
-            'image': (filename, image_data, 'image/jpeg')
+            'image': (filename, image_data, content_type)
         }
         
-        response = requests.patch(url, files=files, timeout=30)
+        response = limited_request('PATCH', url, files=files, timeout=30)
         if response.status_code == 200:
             return True
         else:
@@ -187,127 +283,184 @@ def get_search_term(item):
     """Get search term for image search based on item name"""
     # Try to get the best name (prefer English, then Uzbek, then Russian)
     name = item.get('name') or item.get('name_uz') or item.get('name_ru') or ""
-    name = name.lower().strip()
     
     # Remove common words and size indicators
-    common_words = ['pitsa', 'pizza', 'katta', 'kichik', 'juda', 'large', 'small', 'big', 'little', 
-                   'taom', 'dish', 'o\'rta', 'medium', '1', '2', '3', '4', 'assorti', 'assorted',
-                   'bon', 'file', 'filet', '(', ')', 'mol', 'go\'shti', 'meat']
-    
-    words = name.split()
-    keywords = [w.replace("'", "").replace("(", "").replace(")", "") 
-                for w in words if w.lower() not in common_words and len(w) > 2]
-    
+    keywords = food_terms.search_keywords(name)
     if keywords:
-        return "+".join(keywords[:3])
+        return "+".join(keywords)
     else:
         # Fallback: use first meaningful word
-        clean_name = name.replace("(", "").replace(")", "").replace("'", "")
-        return clean_name.replace(" ", "+")[:50] if clean_name else "food"
+        clean_name = "+".join(food_terms.tokenize(name))
+        return clean_name[:50] if clean_name else "food"
+
+
+def resolve_stage(job):
+    """Pipeline stage: find an image URL for the item"""
+    search_term = get_search_term(job['item'])
+    job['search_term'] = search_term
+
+    # Get image URL (try multiple times with different terms)
+    attempts = [
+        search_term,
+        translate_to_english(search_term),
+        "food",  # Generic fallback
+    ]
+    for attempt_term in attempts:
+        job['image_url'] = get_image_url(attempt_term)
+        if job['image_url']:
+            return True
+
+    job['error'] = f"Rasm topilmadi (qidiruv: {search_term})"
+    return False
+
+
+def download_stage(job):
+    """Pipeline stage: download the image"""
+    job['download'] = download_image(job['image_url'])
+    if not job['download']:
+        job['error'] = "Rasm yuklab bo'lmadi"
+        return False
+    return True
+
+
+def upload_stage(job):
+    """Pipeline stage: upload the image to the API"""
+    filename = f"{job['item_id']}_{job['name']}.jpg"
+    filename = "".join(c for c in filename if c.isalnum() or c in (' ', '-', '_', '.')).rstrip()
+
+    with job.pop('download') as download:
+        download.file.seek(0)
+        if update_menu_item_image(job['item_id'], download.file, filename, download.content_type):
+            job['status'] = 'updated'
+            return True
+    job['error'] = "Saqlashda xatolik"
+    return False
 
 
-def main():
+def default_journal_path():
+    """Checkpoint journal location (one journal per API host)"""
+    host = urlsplit(API_URL).hostname or 'api'
+    return os.path.join(os.path.expanduser('~'), '.cache', 'tokyo', f"add_images_via_api.{host}.jsonl")
+
+
+def main(resolve_workers=DEFAULT_RESOLVE_WORKERS, download_workers=DEFAULT_DOWNLOAD_WORKERS,
+         upload_workers=DEFAULT_UPLOAD_WORKERS, queue_size=DEFAULT_QUEUE_SIZE,
+         journal_path=None, restart=False):
     print("=" * 60)
     print("Mahsulotlarga Rasmlar Qo'shish (API orqali)")
     print("=" * 60)
     print()
     
+    journal = CheckpointJournal(journal_path or default_journal_path())
+    if restart:
+        journal.reset()
+    elif journal.counts():
+        print(f"♻️  Oldingi ishga tushirish davom ettiriladi: {journal.counts()} ({journal.path})")
+        print()
+    
     # Get all menu items
     print("Mahsulotlarni yuklanmoqda...")
-    items = get_menu_items()
+    counts = {'total': 0, 'updated': 0, 'skipped': 0, 'failed': 0, 'resumed': 0}
     
-    if not items:
-        print("Xatolik: Mahsulotlar topilmadi yoki API'ga ulanishda muammo bor")
-        return
+    def iter_jobs():
+        # Mahsulotlar kelishi bilan navbatga qo'yiladi (butun katalog kutilmaydi)
+        for idx, item in enumerate(get_menu_items(), 1):
+            counts['total'] += 1
+            item_name = item.get('name_uz') or item.get('name') or 'Noma\'lum'
+            
+            # Oldingi ishga tushirishda bajarilgan (faqat xatoliklar qayta uriniladi)
+            if journal.is_done(item.get('id')):
+                counts['resumed'] += 1
+                continue
+            
+            # Skip if already has image
+            if item.get('image'):
+                print(f"[{idx}] ⏭️  O'tkazib yuborildi: {item_name} (rasm mavjud)")
+                journal.record(item.get('id'), 'skipped', 'rasm mavjud')
+                counts['skipped'] += 1
+                continue
+            
+            yield {'idx': idx, 'item': item, 'item_id': item.get('id'), 'name': item_name}
     
-    total = len(items)
-    print(f"Jami {total} ta mahsulot topildi")
+    # Qidirish -> yuklab olish -> API'ga saqlash bosqichlari parallel ishlaydi
+    print(f"🔍 Rasmlar qidirilmoqda "
+          f"(qidiruv: {resolve_workers}, yuklash: {download_workers}, saqlash: {upload_workers} oqim)")
     print()
+    stages = [
+        ('resolve', resolve_stage, resolve_workers),
+        ('download', download_stage, download_workers),
+        ('upload', upload_stage, upload_workers),
+    ]
+    try:
+        for job in run_pipeline(iter_jobs(), stages, queue_size=queue_size):
+            if job.get('status') == 'updated':
+                print(f"[{job['idx']}] ✅ Muvaffaqiyatli qo'shildi: {job['name']}")
+                journal.record(job['item_id'], 'updated')
+                counts['updated'] += 1
+            else:
+                print(f"[{job['idx']}] ❌ {job['name']}: {job.get('error')}")
+                journal.record(job['item_id'], 'failed', job.get('error'))
+                counts['failed'] += 1
+    finally:
+        # To'xtatilganda ham keshlar saqlanadi
+        image_sources.close()
+        image_cache.save()
+        resolve_cache.save()
+
+    # Ishga tushirish oxirigacha yetdi: jurnal faqat uzilgan ishga tushirishni davom ettirish uchun
+    journal.reset()
     
-    updated = 0
-    skipped = 0
-    failed = 0
-    
-    for idx, item in enumerate(items, 1):
-        item_id = item.get('id')
-        item_name = item.get('name_uz') or item.get('name') or 'Noma\'lum'
-        
-        # Skip if already has image
-        if item.get('image'):
-            print(f"[{idx}/{total}] ⏭️  O'tkazib yuborildi: {item_name} (rasm mavjud)")
-            skipped += 1
-            continue
-        
-        print(f"[{idx}/{total}] 🔍 Qidirilmoqda: {item_name}")
-        
-        # Get search term
-        search_term = get_search_term(item)
-        print(f"  Qidiruv so'zi: {search_term}")
-        
-        # Get image URL (try multiple times with different terms)
-        image_url = None
-        attempts = [
-            search_term,
-            translate_to_english(search_term),
-            "food",  # Generic fallback
-        ]
-        
-        for attempt_term in attempts:
-            image_url = get_image_url(attempt_term)
-            if image_url:
-                break
-        
-        if not image_url:
-            print(f"  ❌ Rasm topilmadi (qidiruv: {search_term})")
-            failed += 1
-            time.sleep(1)  # Rate limiting
-            continue
-        
-        print(f"  📥 Rasm yuklanmoqda...")
-        
-        # Download image
-        image_data = download_image(image_url)
-        
-        if not image_data:
-            print(f"  ❌ Rasm yuklab bo'lmadi")
-            failed += 1
-            time.sleep(1)
-            continue
-        
-        # Generate filename
-        filename = f"{item_id}_{item_name}.jpg"
-        filename = "".join(c for c in filename if c.isalnum() or c in (' ', '-', '_', '.')).rstrip()
-        
-        # Update via API
-        print(f"  💾 API orqali saqlanmoqda...")
-        success = update_menu_item_image(item_id, image_data, filename)
-        
-        if success:
-            print(f"  ✅ Muvaffaqiyatli qo'shildi!")
-            updated += 1
-        else:
-            print(f"  ❌ Saqlashda xatolik")
-            failed += 1
-        
-        # Rate limiting
-        time.sleep(2)  # 2 seconds between requests
-        print()
-    
+    if not counts['total']:
+        print("Xatolik: Mahsulotlar topilmadi yoki API'ga ulanishda muammo bor")
+        return
+
     # Summary
+    print()
     print("=" * 60)
     print("Yakuniy natija:")
-    print(f"  Jami: {total}")
-    print(f"  ✅ Yangilandi: {updated}")
-    print(f"  ⏭️  O'tkazib yuborildi: {skipped}")
-    print(f"  ❌ Xatolik: {failed}")
+    print(f"  Jami: {counts['total']}")
+    print(f"  ✅ Yangilandi: {counts['updated']}")
+    print(f"  ⏭️  O'tkazib yuborildi: {counts['skipped']}")
+    print(f"  ♻️  Oldin bajarilgan: {counts['resumed']}")
+    print(f"  ❌ Xatolik: {counts['failed']}")
     print("=" * 60)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add images to products via API")
+    parser.add_argument('--api-rps', type=float, default=DEFAULT_API_RPS,
+                        help="Max requests per second to the API")
+    parser.add_argument('--image-rps', type=float, default=DEFAULT_IMAGE_RPS,
+                        help="Max requests per second to each image source")
+    parser.add_argument('--resolve-workers', type=int, default=DEFAULT_RESOLVE_WORKERS,
+                        help="Concurrent image URL lookups")
+    parser.add_argument('--download-workers', type=int, default=DEFAULT_DOWNLOAD_WORKERS,
+                        help="Concurrent image downloads")
+    parser.add_argument('--upload-workers', type=int, default=DEFAULT_UPLOAD_WORKERS,
+                        help="Concurrent API uploads")
+    parser.add_argument('--resolve-deadline', type=float, default=DEFAULT_RESOLVE_DEADLINE,
+                        help="Seconds to wait for the image sources of one item before using the fallback")
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                        help="Max jobs waiting between two stages")
+    parser.add_argument('--journal', default=None,
+                        help="Checkpoint journal file (default: ~/.cache/tokyo/add_images_via_api.<host>.jsonl)")
+    parser.add_argument('--restart', action='store_true',
+                        help="Ignore the checkpoint journal and process all items again")
+    parser.add_argument('--api-url', default=None,
+                        help=f"API base URL (default: $TOKYO_API_URL or {PRODUCTION_API_URL})")
+    parser.add_argument('--image-base-url', default=None,
+                        help="Fetch images from this server instead of the real hosts "
+                             "(default: $TOKYO_IMAGE_BASE_URL), e.g. scripts/fake_server.py")
+    args = parser.parse_args()
+    configure_endpoints(args.api_url, args.image_base_url)
+    configure_rate_limits(args.api_rps, args.image_rps)
+    image_sources.deadline = args.resolve_deadline
+
     try:
-        main()
+        main(args.resolve_workers, args.download_workers, args.upload_workers, args.queue_size,
+             journal_path=args.journal, restart=args.restart)
     except KeyboardInterrupt:
-        print("\n\n⚠️  To'xtatildi (Ctrl+C)")
+        print("\n\n⚠️  To'xtatildi (Ctrl+C). Qayta ishga tushirilsa, shu joydan davom etadi")
     except Exception as e:
         print(f"\n\n❌ Xatolik: {e}")
         import traceback
@@ -0,0 +1,160 @@
+"""
+Batch logo / asset processing across a process pool
+
+Runs create_logo_with_exact_size (create_logo_v3.py, mode "exact") or
+create_resized_transparent_logo (create_logo_v2.py, mode "resized") on
+every matching image. Each output is written to a temp file in the output
+directory and renamed into place, so a crashed run never leaves half
+written PNGs behind.
+
+Output paths keep the input's path relative to its directory argument (or
+to the part of a glob pattern before the first wildcard), so
+"branches/*/logo.png" gives <out-dir>/<branch>/logo.png. If two inputs
+would share an output, the run stops before anything is processed.
+
+Usage:
+    python scripts/batch_logos.py "branches/*/logo.png" icons/ --out-dir public/logos
+    python scripts/batch_logos.py banners/ --mode resized --workers 8
+"""
+import argparse
+import contextlib
+import glob
+import io
+import os
+import re
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Add parent directory to path to import the create_logo_* scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+_MAGIC_RE = re.compile(r'[*?[]')
+
+
+def _pattern_root(pattern):
+    """Directory part of a glob pattern before its first wildcard ('' for the current directory)"""
+    parts = []
+    for part in os.path.normpath(pattern).split(os.sep)[:-1]:
+        if _MAGIC_RE.search(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts)
+
+
+def collect_inputs(patterns):
+    """
+    Expand files, directories and glob patterns into a sorted list of
+    (image_path, root) pairs; root is the directory the output path is
+    kept relative to.
+    """
+    roots = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            root = pattern
+            candidates = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+        else:
+            root = _pattern_root(pattern)
+            candidates = glob.glob(pattern, recursive=True)
+        for path in candidates:
+            if os.path.isfile(path) and path.lower().endswith(IMAGE_EXTENSIONS):
+                roots.setdefault(path, root)
+    return sorted(roots.items())
+
+
+def output_path_for(input_path, root, out_dir, suffix):
+    """out_dir/<path relative to root, without extension><suffix>.png"""
+    name = os.path.splitext(os.path.relpath(input_path, root or '.'))[0]
+    return os.path.join(out_dir, f"{name}{suffix}.png")
+
+
+def plan_outputs(inputs, out_dir, suffix):
+    """Map every input to its output path; ValueError if two inputs share one"""
+    outputs = {}
+    sources = {}
+    for input_path, root in inputs:
+        output_path = output_path_for(input_path, root, out_dir, suffix)
+        key = os.path.normcase(os.path.abspath(output_path))
+        if key in sources:
+            raise ValueError(f"{sources[key]} and {input_path} would both be written to {output_path}")
+        sources[key] = input_path
+        outputs[input_path] = output_path
+    return outputs
+
+
+def process_image(input_path, output_path, mode):
+    """Process one image in a worker process; returns (input_path, ok, log)"""
+    from create_logo_v2 import create_resized_transparent_logo
+    from create_logo_v3 import create_logo_with_exact_size
+
+    out_dir = os.path.dirname(output_path) or '.'
+    os.makedirs(out_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix='.tmp-', suffix='.png')
+    os.close(fd)
+
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            if mode == 'exact':
+                create_logo_with_exact_size(input_path, tmp_path)
+            else:
+                create_resized_transparent_logo(input_path, tmp_path)
+        # Funksiya xatolikda faylni yozmasdan qaytadi
+        if os.path.getsize(tmp_path) == 0:
+            return input_path, False, log.getvalue()
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_path)
+        return input_path, True, log.getvalue()
+    except Exception as e:
+        return input_path, False, f"{log.getvalue()}{e}\n"
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch logo / asset processing")
+    parser.add_argument('inputs', nargs='+', help="Image files, directories or glob patterns")
+    parser.add_argument('--out-dir', default='processed', help="Output directory")
+    parser.add_argument('--mode', choices=('exact', 'resized'), default='exact',
+                        help="exact: create_logo_v3 (green circle size), resized: create_logo_v2 (red logo on green-circle canvas)")
+    parser.add_argument('--suffix', default='', help="Suffix added to output file names")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Print each worker's log")
+    args = parser.parse_args()
+
+    inputs = collect_inputs(args.inputs)
+    if not inputs:
+        print("❌ Rasm topilmadi")
+        return 1
+    try:
+        outputs = plan_outputs(inputs, args.out_dir, args.suffix)
+    except ValueError as e:
+        print(f"❌ Natija fayllari ustma-ust tushadi: {e}")
+        return 1
+
+    workers = max(1, min(args.workers, len(inputs)))
+    print(f"🖼️ {len(inputs)} ta rasm, {workers} ta jarayon")
+    ok = failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(process_image, path, output_path, args.mode)
+                   for path, output_path in outputs.items()]
+        for future in as_completed(futures):
+            input_path, success, log = future.result()
+            if success:
+                ok += 1
+                print(f"✅ {input_path} -> {outputs[input_path]}")
+            else:
+                failed += 1
+                print(f"❌ {input_path}")
+            if args.verbose or not success:
+                print("   " + log.strip().replace("\n", "\n   "))
+
+    print(f"🎉 Tayyor: {ok}, ❌ xatolik: {failed}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
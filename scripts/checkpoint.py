@@ -0,0 +1,72 @@
+"""
+Append-only checkpoint journal for resumable batch scripts
+
+Every processed item gets one JSON line: {"id", "status", "reason", "ts"}.
+Lines are written with a single O_APPEND write followed by fsync, so an
+interrupted run leaves at most one truncated last line, which is ignored
+on load. The latest line for an id wins.
+"""
+import json
+import os
+import threading
+import time
+
+# Qayta ishga tushirilganda bu holatdagi mahsulotlar o'tkazib yuboriladi
+DONE_STATUSES = ('updated', 'skipped')
+
+
+class CheckpointJournal:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._outcomes = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Uzilib qolgan oxirgi qator
+                        continue
+                    self._outcomes[str(entry['id'])] = entry
+        except OSError:
+            pass
+
+    def reset(self):
+        """Forget all recorded outcomes and truncate the journal"""
+        with self._lock:
+            self._outcomes = {}
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def status(self, item_id):
+        entry = self._outcomes.get(str(item_id))
+        return entry['status'] if entry else None
+
+    def is_done(self, item_id):
+        return self.status(item_id) in DONE_STATUSES
+
+    def counts(self):
+        counts = {}
+        for entry in self._outcomes.values():
+            counts[entry['status']] = counts.get(entry['status'], 0) + 1
+        return counts
+
+    def record(self, item_id, status, reason=None):
+        """Atomically append the outcome of one item"""
+        entry = {'id': item_id, 'status': status, 'reason': reason, 'ts': time.time()}
+        line = (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._outcomes[str(item_id)] = entry
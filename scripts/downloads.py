@@ -0,0 +1,82 @@
+"""
+Streaming image downloads with size and content-type limits
+
+The response body is read in chunks, hashed while it is read and spooled
+to a temporary file, so memory stays flat no matter how large the body is.
+Downloads that are not images or exceed the size limit are rejected.
+
+    TOKYO_MAX_IMAGE_MB   size limit in megabytes (default 10)
+"""
+import hashlib
+import os
+import tempfile
+
+CHUNK_SIZE = 64 * 1024
+MAX_IMAGE_BYTES = int(float(os.environ.get('TOKYO_MAX_IMAGE_MB', 10)) * 1024 * 1024)
+
+
+class DownloadError(IOError):
+    pass
+
+
+class Download:
+    """A downloaded (or cached) image: open binary file + SHA-256, size and type"""
+
+    def __init__(self, file, sha256, size, content_type='image/jpeg'):
+        self.file = file
+        self.sha256 = sha256
+        self.size = size
+        self.content_type = content_type
+
+    def read(self):
+        self.file.seek(0)
+        return self.file.read()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def stream_download(get, url, timeout=15, max_bytes=MAX_IMAGE_BYTES, allowed_type='image/'):
+    """
+    Download url with get(url, stream=True, timeout=...) and return a Download.
+
+    Raises DownloadError on a non-200 status, a non-image Content-Type or a
+    body larger than max_bytes.
+    """
+    response = get(url, stream=True, timeout=timeout)
+    try:
+        if response.status_code != 200:
+            raise DownloadError(f"HTTP {response.status_code}")
+
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if not content_type.startswith(allowed_type):
+            raise DownloadError(f"not an image (Content-Type: {content_type or 'missing'})")
+
+        length = response.headers.get('Content-Length')
+        if length and length.isdigit() and int(length) > max_bytes:
+            raise DownloadError(f"too large ({int(length)} > {max_bytes} bytes)")
+
+        hasher = hashlib.sha256()
+        size = 0
+        spool = tempfile.TemporaryFile()
+        try:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                size += len(chunk)
+                # Content-Length bo'lmasa ham chegara o'qish paytida tekshiriladi
+                if size > max_bytes:
+                    raise DownloadError(f"too large (> {max_bytes} bytes)")
+                hasher.update(chunk)
+                spool.write(chunk)
+        except Exception:
+            spool.close()
+            raise
+        spool.seek(0)
+        return Download(spool, hasher.hexdigest(), size, content_type)
+    finally:
+        response.close()
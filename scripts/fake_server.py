@@ -0,0 +1,294 @@
+"""
+Local stand-in for the Tokyo API and the image hosts (offline, repeatable runs)
+
+Endpoints:
+    GET   /api/menu-items/?page=1&page_size=100   DRF-style paginated catalog
+    GET   /api/menu-items/<id>/                   one item
+    PATCH /api/menu-items/<id>/                   multipart image upload (sets "image")
+    GET   /foodish-api.herokuapp.com/images/      Foodish-like {"image": url}
+    GET   /source.unsplash.com/...                302 to an images.unsplash.com path
+    GET   /<host>/<path>?w=800&h=600              deterministic JPEG for any other path
+    GET   /stats                                  request counters (never faulted)
+
+Image hosts are addressed as "<base>/<host>/<path>", which is how
+add_images_via_api.py --image-base-url rewrites its image URLs.
+
+Usage:
+    python scripts/fake_server.py --port 8765 --items 500 --latency 0.05 --error-rate 0.02 --rate-429 0.05
+    python scripts/add_images_via_api.py --api-url http://127.0.0.1:8765/api --image-base-url http://localhost:8765
+
+Addressing the images as "localhost" keeps them on a separate rate budget
+from the API host, as with the real hosts.
+
+In-process use (benchmarks), on a free port:
+
+    with FakeTokyoServer(('127.0.0.1', 0), latency=0.02) as server:
+        server.base_url
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from PIL import Image, ImageDraw
+
+# Add parent directory to path to import from scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.seed_loader import iter_records
+
+SEED_ITEMS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'seed_data', 'tokyo', 'menu_items.jsonl')
+FIXTURE_COUNT = 16
+MAX_FIXTURE_SIDE = 4000
+_ITEM_RE = re.compile(r'^/api/menu-items/(\d+)/$')
+
+
+def fixture_jpeg(width=800, height=600, seed=0, quality=85):
+    """A deterministic JPEG with some detail (gradient plus random shapes)"""
+    rng = random.Random(seed)
+    img = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+    draw = ImageDraw.Draw(img)
+    for _ in range(40):
+        x, y = rng.randrange(width), rng.randrange(height)
+        r = rng.randrange(10, max(11, width // 6))
+        draw.ellipse((x - r, y - r, x + r, y + r), fill=tuple(rng.randrange(256) for _ in range(3)))
+    buffer = io.BytesIO()
+    img.save(buffer, 'JPEG', quality=quality)
+    return buffer.getvalue()
+
+
+def fake_catalog(count, with_image=0.2, seed=0):
+    """`count` API-shaped menu items built from the seed catalog; a share already has an image"""
+    rng = random.Random(seed)
+    templates = list(iter_records(SEED_ITEMS))
+    items = {}
+    for item_id in range(1, count + 1):
+        item = dict(templates[(item_id - 1) % len(templates)], id=item_id)
+        if item_id > len(templates):
+            for field in ('name', 'name_uz', 'name_ru'):
+                item[field] = f"{item[field]} {item_id}"
+        item['image'] = f"/media/menu_items/{item_id}.jpg" if rng.random() < with_image else None
+        items[item_id] = item
+    return items
+
+
+class FakeTokyoServer(ThreadingHTTPServer):
+    """
+    HTTP server holding the fake catalog and the fault settings.
+
+    Every request (except /stats) first waits `latency` seconds (plus up
+    to `jitter`), then fails with 429 (Retry-After: `retry_after`) with
+    probability `rate_429`, or with 503 with probability `error_rate`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, items=200, with_image=0.2, latency=0.0, jitter=0.0,
+                 error_rate=0.0, rate_429=0.0, retry_after=1, seed=0):
+        super().__init__(address, FakeHandler)
+        self.catalog_options = (items, with_image, seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.lock = threading.Lock()
+        self._fixtures = {}
+        self._thread = None
+        self.reset()
+
+    def reset(self):
+        """Fresh catalog, counters and random state (e.g. between benchmark runs)"""
+        items, with_image, seed = self.catalog_options
+        with self.lock:
+            self.items = fake_catalog(items, with_image, seed)
+            self.random = random.Random(seed)
+            self.stats = {'requests': 0, 'patches': 0, 'uploaded_bytes': 0, 'images': 0,
+                          'errors': 0, 'throttled': 0}
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key, amount=1):
+        with self.lock:
+            self.stats[key] += amount
+
+    def fault(self):
+        """Return the status of an injected failure (429 / 503), or None"""
+        with self.lock:
+            roll = self.random.random()
+            delay = self.latency + self.random.random() * self.jitter
+        if delay:
+            time.sleep(delay)
+        if roll < self.rate_429:
+            return 429
+        if roll < self.rate_429 + self.error_rate:
+            return 503
+        return None
+
+    def fixture(self, path, width=800, height=600):
+        """Same JPEG for the same path and size; FIXTURE_COUNT distinct images per size"""
+        index = int(hashlib.sha256(path.encode('utf-8')).hexdigest(), 16) % FIXTURE_COUNT
+        key = (index, min(width, MAX_FIXTURE_SIDE), min(height, MAX_FIXTURE_SIDE))
+        with self.lock:
+            if key not in self._fixtures:
+                self._fixtures[key] = fixture_jpeg(key[1], key[2], seed=index)
+            return self._fixtures[key]
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b'', content_type='application/json', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _base_url(self):
+        # Mijoz qaysi nom bilan murojaat qilgan bo'lsa, havolalar ham shu nom bilan qaytadi
+        host = self.headers.get('Host')
+        return f"http://{host}" if host else self.server.base_url
+
+    def _json(self, data, status=200):
+        self._send(status, json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+    def _read_body(self):
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            body = b''
+            while True:
+                size = int(self.rfile.readline().strip() or b'0', 16)
+                if not size:
+                    self.rfile.readline()
+                    return body
+                body += self.rfile.read(size)
+                self.rfile.readline()
+        return self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+    def _handle(self):
+        server = self.server
+        url = urlsplit(self.path)
+        if url.path == '/stats':
+            with server.lock:
+                return self._json(dict(server.stats))
+
+        # PATCH tanasi xatolik qaytarilganda ham o'qiladi (ulanish qayta ishlatiladi)
+        body = self._read_body() if self.command == 'PATCH' else b''
+        server.count('requests')
+        status = server.fault()
+        if status == 429:
+            server.count('throttled')
+            return self._send(429, b'{"detail": "Request was throttled."}',
+                              headers={'Retry-After': str(server.retry_after)})
+        if status:
+            server.count('errors')
+            return self._json({'detail': 'Service unavailable'}, status)
+
+        if url.path == '/api/menu-items/' and self.command == 'GET':
+            return self._menu_page(url)
+        match = _ITEM_RE.match(url.path)
+        if match:
+            return self._menu_item(int(match.group(1)), body)
+        if url.path.rstrip('/') == '/foodish-api.herokuapp.com/images':
+            category = server.random.choice(['pizza', 'burger', 'pasta', 'rice', 'dessert'])
+            number = server.random.randrange(1, 50)
+            return self._json({'image': f"https://foodish-api.herokuapp.com/images/{category}/{category}{number}.jpg"})
+        if url.path.startswith('/source.unsplash.com/'):
+            photo = hashlib.sha256(self.path.encode('utf-8')).hexdigest()[:12]
+            location = f"{self._base_url()}/images.unsplash.com/photo-{photo}?w=800&h=800&fit=crop"
+            return self._send(302, headers={'Location': location})
+        if self.command in ('GET', 'HEAD') and url.path.count('/') >= 2:
+            server.count('images')
+            query = parse_qs(url.query)
+            width = int(query.get('w', ['800'])[0])
+            height = int(query.get('h', ['600'])[0])
+            return self._send(200, server.fixture(url.path, width, height), content_type='image/jpeg')
+        return self._json({'detail': 'Not found.'}, 404)
+
+    def _menu_page(self, url):
+        query = parse_qs(url.query)
+        page = max(1, int(query.get('page', ['1'])[0]))
+        page_size = max(1, int(query.get('page_size', ['20'])[0]))
+        items = list(self.server.items.values())
+        start = (page - 1) * page_size
+        base = f"{self._base_url()}/api/menu-items/?show_all=true&page_size={page_size}"
+        self._json({
+            'count': len(items),
+            'next': f"{base}&page={page + 1}" if start + page_size < len(items) else None,
+            'previous': f"{base}&page={page - 1}" if page > 1 else None,
+            'results': items[start:start + page_size],
+        })
+
+    def _menu_item(self, item_id, body):
+        item = self.server.items.get(item_id)
+        if item is None:
+            return self._json({'detail': 'Not found.'}, 404)
+        if self.command == 'PATCH':
+            if b'name="image"' not in body:
+                return self._json({'image': ['No file was submitted.']}, 400)
+            with self.server.lock:
+                item['image'] = f"/media/menu_items/{item_id}.jpg"
+                self.server.stats['patches'] += 1
+                self.server.stats['uploaded_bytes'] += len(body)
+        return self._json(item)
+
+    do_GET = do_HEAD = do_PATCH = _handle
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Tokyo API and image hosts")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--items', type=int, default=200, help="Number of menu items")
+    parser.add_argument('--with-image', type=float, default=0.2, help="Share of items that already have an image")
+    parser.add_argument('--latency', type=float, default=0.0, help="Delay per request in seconds")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Extra random delay up to this many seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument('--rate-429', type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument('--retry-after', type=int, default=1, help="Retry-After seconds sent with 429")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (catalog and faults)")
+    args = parser.parse_args()
+
+    server = FakeTokyoServer((args.host, args.port), items=args.items, with_image=args.with_image,
+                             latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                             rate_429=args.rate_429, retry_after=args.retry_after, seed=args.seed)
+    print(f"🧪 Fake Tokyo server: {server.base_url} ({args.items} items)")
+    print(f"   python scripts/add_images_via_api.py --api-url {server.base_url}/api "
+          f"--image-base-url http://localhost:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 {server.stats}")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
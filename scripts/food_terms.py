@@ -0,0 +1,204 @@
+"""
+Food term normalization (uz / ru / en), built once at import
+
+- STOPWORDS: frozen set of size / filler words dropped from search terms
+- TERM_TRIE: word-level trie of known food terms, including multi-word
+  ones ("mol go'shti", "tovuq qanotlari"); matching a name walks it once
+  per position, i.e. O(number of words) for the short phrases it holds
+- IMAGE_KEYS: English term -> key of the static image map
+
+No Django or network imports, so the backend search can reuse it.
+"""
+import re
+
+# Apostrof turlari (o', oʻ, o’, o`) va qavslar olib tashlanadi
+_STRIP_RE = re.compile(r"['‘’ʻʼ`()]")
+_SPLIT_RE = re.compile(r"[\s+]+")
+
+STOPWORDS = frozenset({
+    'pitsa', 'pizza', 'katta', 'kichik', 'juda', 'large', 'small', 'big', 'little',
+    'taom', 'dish', 'orta', 'medium', '1', '2', '3', '4', 'assorti', 'assorted',
+    'bon', 'file', 'filet', 'mol', 'goshti', 'meat',
+    'большая', 'большой', 'маленькая', 'маленький', 'средняя', 'средний', 'блюдо', 'ассорти',
+})
+
+# Source term (normalized) -> English search term; values may hold several words joined by '+'
+TRANSLATIONS = {
+    'pitsa': 'pizza',
+    'pizza': 'pizza',
+    'shashlik': 'kebab',
+    'kebab': 'kebab',
+    'steyk': 'steak',
+    'steak': 'steak',
+    'tovuq': 'chicken',
+    'chicken': 'chicken',
+    'pasta': 'pasta',
+    'salat': 'salad',
+    'salatlar': 'salad',
+    'soup': 'soup',
+    'shorva': 'soup',
+    'desert': 'dessert',
+    'desertlar': 'dessert',
+    'ichimlik': 'drink',
+    'drink': 'drink',
+    'sushi': 'sushi',
+    'ramen': 'ramen',
+    'lagmon': 'noodles',
+    'non': 'bread',
+    'bread': 'bread',
+    'katta': 'large',
+    'kichik': 'small',
+    'orta': 'medium',
+    'juda': 'very',
+    'adana': 'adana',
+    'bon': 'filet',
+    'file': 'filet',
+    'qanotlari': 'wings',
+    'wings': 'wings',
+    'lososli': 'salmon',
+    'salmon': 'salmon',
+    'qaymoqli': 'cream',
+    'cream': 'cream',
+    'pishloqli': 'cheese',
+    'cheese': 'cheese',
+    'vafl': 'waffle',
+    'waffle': 'waffle',
+    'katlet': 'cutlet',
+    'cutlet': 'cutlet',
+    'bogir': 'lamb',
+    'mol': 'beef',
+    'goshti': 'meat',
+    # Ko'p so'zli atamalar
+    'mol goshti': 'beef',
+    'qoy goshti': 'lamb',
+    'tovuq goshti': 'chicken',
+    'tovuq qanotlari': 'chicken+wings',
+    'chicken wings': 'chicken+wings',
+    # Русские названия
+    'пицца': 'pizza',
+    'шашлык': 'kebab',
+    'стейк': 'steak',
+    'курица': 'chicken',
+    'куриные крылышки': 'chicken+wings',
+    'крылышки': 'wings',
+    'паста': 'pasta',
+    'салат': 'salad',
+    'суп': 'soup',
+    'десерт': 'dessert',
+    'напиток': 'drink',
+    'напитки': 'drink',
+    'суши': 'sushi',
+    'рамен': 'ramen',
+    'лагман': 'noodles',
+    'хлеб': 'bread',
+    'лепешка': 'bread',
+    'лосось': 'salmon',
+    'сыр': 'cheese',
+    'вафли': 'waffle',
+    'котлета': 'cutlet',
+    'говядина': 'beef',
+    'баранина': 'lamb',
+}
+
+# English term -> key of the static image map (FOOD_IMAGES in add_images_via_api.py)
+IMAGE_KEYS = {key: key for key in (
+    'pizza', 'kebab', 'steak', 'chicken', 'pasta', 'salad', 'soup', 'dessert', 'drink',
+    'sushi', 'ramen', 'noodles', 'bread', 'waffle', 'cutlet', 'lamb', 'beef', 'salmon',
+)}
+IMAGE_KEYS.update({
+    'pizzas': 'pizza',
+    'kebabs': 'kebab',
+    'steaks': 'steak',
+    'salads': 'salad',
+    'soups': 'soup',
+    'desserts': 'dessert',
+    'drinks': 'drink',
+    'waffles': 'waffle',
+    'cutlets': 'cutlet',
+})
+
+
+def normalize(text):
+    """Lowercase and drop apostrophes and brackets ("O'rta" -> "orta")"""
+    return _STRIP_RE.sub('', text.lower())
+
+
+def tokenize(text):
+    """Normalize, then split on whitespace and '+'"""
+    return [token for token in _SPLIT_RE.split(normalize(text)) if token]
+
+
+class TermTrie:
+    """Word-level trie; match() finds the longest known term at a position"""
+
+    _END = object()
+
+    def __init__(self, terms):
+        self._root = {}
+        for term, value in terms.items():
+            node = self._root
+            for token in tokenize(term):
+                node = node.setdefault(token, {})
+            node[self._END] = value
+
+    def match(self, tokens, start):
+        """Return (length, value) of the longest term starting at tokens[start], or (0, None)"""
+        node = self._root
+        best = (0, None)
+        for index in range(start, len(tokens)):
+            node = node.get(tokens[index])
+            if node is None:
+                break
+            if self._END in node:
+                best = (index - start + 1, node[self._END])
+        return best
+
+    def segment(self, tokens):
+        """Split tokens into (words, value) pieces; unknown words get value None"""
+        pieces = []
+        start = 0
+        while start < len(tokens):
+            length, value = self.match(tokens, start)
+            length = length or 1
+            pieces.append((tokens[start:start + length], value))
+            start += length
+        return pieces
+
+
+TERM_TRIE = TermTrie(TRANSLATIONS)
+
+
+def search_keywords(name, limit=3):
+    """
+    Meaningful words of a product name: stopwords and short words are
+    dropped, except inside known multi-word terms ("mol go'shti").
+    """
+    keywords = []
+    for words, value in TERM_TRIE.segment(tokenize(name)):
+        if value is not None and len(words) > 1:
+            keywords.extend(words)
+        elif words[0] not in STOPWORDS and len(words[0]) > 2:
+            keywords.append(words[0])
+        if len(keywords) >= limit:
+            break
+    return keywords[:limit]
+
+
+def to_english(term, limit=3):
+    """Translate a '+' / space separated term; unknown words longer than 2 letters are kept"""
+    translated = []
+    for words, value in TERM_TRIE.segment(tokenize(term)):
+        if value is not None:
+            translated.append(value)
+        elif len(words[0]) > 2:
+            translated.append(words[0])
+    return '+'.join(translated[:limit])
+
+
+def image_key(english_term):
+    """Key of the static image map for the first English word that has one, or None"""
+    for token in tokenize(english_term):
+        key = IMAGE_KEYS.get(token)
+        if key is not None:
+            return key
+    return None
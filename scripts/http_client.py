@@ -0,0 +1,108 @@
+"""
+Shared HTTP client for the data and image scripts
+
+One requests.Session per process with per-host connection pools and
+HTTP keep-alive, so repeated calls to api.tokyokafe.uz or
+images.unsplash.com reuse TCP/TLS connections. Transient failures
+(connection errors, 429, 5xx) are retried with exponential, jittered
+backoff that honours Retry-After; every request gets a default timeout.
+
+Callers that pace requests with scripts.rate_limit use status_retries=False:
+urllib3 then retries only connection/read errors, and 429/5xx come back to
+the caller, which retries them through its limiter.
+
+    TOKYO_HTTP_RETRIES     retries per request (default 3)
+    TOKYO_HTTP_TIMEOUT     default read timeout in seconds (default 30)
+    TOKYO_IMAGE_BASE_URL   fetch images from this server instead of their real
+                           hosts, e.g. scripts/fake_server.py (see image_host_url)
+"""
+import os
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from scripts.rate_limit import RETRY_STATUSES
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_RETRIES = int(os.environ.get('TOKYO_HTTP_RETRIES', 3))
+DEFAULT_TIMEOUT = (5, float(os.environ.get('TOKYO_HTTP_TIMEOUT', 30)))  # (connect, read)
+
+_shared_sessions = {}
+_shared_lock = threading.Lock()
+_image_base_url = (os.environ.get('TOKYO_IMAGE_BASE_URL') or '').rstrip('/') or None
+
+
+class TimeoutSession(requests.Session):
+    """requests.Session that applies a default timeout to every request"""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT):
+        super().__init__()
+        self.default_timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.default_timeout)
+        return super().request(method, url, **kwargs)
+
+
+def make_retry(retries=DEFAULT_RETRIES, backoff_factor=0.5, backoff_jitter=0.5, status_retries=True):
+    options = dict(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES if status_retries else (),
+        # PATCH faqat rasm maydonini yangilaydi, qayta yuborish xavfsiz
+        allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS', 'PATCH'}),
+        # Aks holda urllib3 Retry-After bilan kelgan 429/503 ni baribir qayta yuboradi
+        respect_retry_after_header=status_retries,
+        # Oxirgi javob qaytariladi, status kodni chaqiruvchi tekshiradi
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=backoff_jitter, **options)
+    except TypeError:
+        # urllib3 < 2.0 has no backoff_jitter
+        return Retry(**options)
+
+
+def make_session(pool_size=DEFAULT_POOL_SIZE, retries=DEFAULT_RETRIES, timeout=DEFAULT_TIMEOUT,
+                 status_retries=True):
+    """Create a session whose per-host pools fit `pool_size` concurrent requests"""
+    session = TimeoutSession(timeout)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=make_retry(retries, status_retries=status_retries))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session(status_retries=True):
+    """Process-wide shared session (created on first use, one per retry mode)"""
+    with _shared_lock:
+        if status_retries not in _shared_sessions:
+            _shared_sessions[status_retries] = make_session(status_retries=status_retries)
+        return _shared_sessions[status_retries]
+
+
+def image_base_url():
+    return _image_base_url
+
+
+def set_image_base_url(url):
+    """Send image requests to `url` (e.g. a local stand-in server); None restores the real hosts"""
+    global _image_base_url
+    _image_base_url = url.rstrip('/') if url else None
+
+
+def image_host_url(url):
+    """
+    https://<host>/<path>?<query> -> <image base>/<host>/<path>?<query> when an
+    image base URL is set; otherwise (or if already rewritten) url is unchanged.
+    """
+    base = _image_base_url
+    if not base or not url or url.startswith(base):
+        return url
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{base}/{parts.netloc}{parts.path}{query}"
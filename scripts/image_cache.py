@@ -0,0 +1,133 @@
+"""
+On-disk, content-addressed cache for downloaded images
+
+Blobs are stored once per SHA-256 of their content; index.json maps each
+URL to its content hash. The total size is bounded and the least recently
+used blobs are evicted first. The cache is shared by every image script:
+
+    TOKYO_IMAGE_CACHE          cache directory (default ~/.cache/tokyo/images)
+    TOKYO_IMAGE_CACHE_MAX_MB   size limit in megabytes (default 500)
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from scripts.downloads import Download
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'tokyo', 'images')
+DEFAULT_MAX_MB = 500
+
+
+def sha256_hex(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+def write_atomic(path, data):
+    """Write bytes (or a binary file object) to path via a temp file and rename,
+    so readers never see partial files"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if hasattr(data, 'read'):
+                shutil.copyfileobj(data, f)
+            else:
+                f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ImageCache:
+    """URL -> content cache with a SHA-256 blob store and LRU eviction"""
+
+    def __init__(self, root=None, max_bytes=None):
+        self.root = root or os.environ.get('TOKYO_IMAGE_CACHE') or DEFAULT_CACHE_DIR
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get('TOKYO_IMAGE_CACHE_MAX_MB', DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(self.root, 'index.json')
+        self._lock = threading.Lock()
+        self._urls = {}
+        self._blobs = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+            self._urls = data.get('urls', {})
+            self._blobs = data.get('blobs', {})
+        except (OSError, ValueError):
+            self._urls, self._blobs = {}, {}
+
+    def _blob_path(self, sha):
+        return os.path.join(self.root, 'blobs', sha[:2], sha)
+
+    def _save_index(self):
+        data = json.dumps({'urls': self._urls, 'blobs': self._blobs}).encode('utf-8')
+        write_atomic(self.index_path, data)
+
+    def _evict(self):
+        total = sum(blob['size'] for blob in self._blobs.values())
+        if total <= self.max_bytes:
+            return
+        # Eng uzoq vaqt ishlatilmagan rasmlar birinchi o'chiriladi
+        for sha, blob in sorted(self._blobs.items(), key=lambda kv: kv[1]['atime']):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._blob_path(sha))
+            except OSError:
+                pass
+            total -= blob['size']
+            del self._blobs[sha]
+        self._urls = {url: sha for url, sha in self._urls.items() if sha in self._blobs}
+
+    def cached_size(self, url):
+        """Size of the cached content for url, or None (does not touch access times)"""
+        with self._lock:
+            blob = self._blobs.get(self._urls.get(url))
+            return blob['size'] if blob else None
+
+    def open(self, url):
+        """Return a Download reading the cached file for url, or None"""
+        with self._lock:
+            sha = self._urls.get(url)
+            if sha is None or sha not in self._blobs:
+                return None
+            try:
+                f = open(self._blob_path(sha), 'rb')
+            except OSError:
+                del self._urls[url]
+                return None
+            blob = self._blobs[sha]
+            blob['atime'] = time.time()
+            return Download(f, sha, blob['size'], blob.get('type', 'image/jpeg'))
+
+    def put_download(self, url, download):
+        """Store a spooled Download for url without loading it into memory"""
+        path = self._blob_path(download.sha256)
+        if not os.path.exists(path):
+            download.file.seek(0)
+            write_atomic(path, download.file)
+            download.file.seek(0)
+        with self._lock:
+            self._blobs[download.sha256] = {'size': download.size, 'atime': time.time(),
+                                            'type': download.content_type}
+            self._urls[url] = download.sha256
+            self._evict()
+            self._save_index()
+        return download.sha256
+
+    def save(self):
+        """Persist access times collected by open()"""
+        with self._lock:
+            self._save_index()
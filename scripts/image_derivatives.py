@@ -0,0 +1,84 @@
+"""
+Responsive image derivatives (WebP, plus AVIF when Pillow supports it)
+
+Every ingested image is resized to a few standard widths. Names are
+derived from the SHA-256 of the source image and the width, e.g.
+"3f2a9c0d1e4b5a6f-640w.webp", so a given file never changes content and
+can be served with the existing `Cache-Control: public, immutable` rule
+for /media/.
+"""
+from io import BytesIO
+
+from PIL import Image, ImageOps, features
+
+from scripts.image_cache import sha256_hex
+
+DERIVATIVE_WIDTHS = (320, 640, 960)
+FORMAT_OPTIONS = {
+    'webp': {'format': 'WEBP', 'quality': 80, 'method': 6},
+    'avif': {'format': 'AVIF', 'quality': 60},
+}
+
+
+def _supported(feature):
+    try:
+        return bool(features.check(feature))
+    except Exception:
+        return False
+
+
+def output_formats():
+    """Formats this Pillow build can write (AVIF needs Pillow 11.2+ or the AVIF plugin)"""
+    return [ext for ext in ('webp', 'avif') if _supported(ext)]
+
+
+def derivative_name(source_sha, width, ext):
+    return f"{source_sha[:16]}-{width}w.{ext}"
+
+
+def _open(source):
+    """Open bytes or a binary file object as a PIL image"""
+    if isinstance(source, bytes):
+        return Image.open(BytesIO(source))
+    source.seek(0)
+    return Image.open(source)
+
+
+def planned_derivatives(source, source_sha=None, widths=DERIVATIVE_WIDTHS, formats=None):
+    """Names (and widths) that generate_derivatives() would produce for source"""
+    formats = output_formats() if formats is None else formats
+    source_sha = source_sha or sha256_hex(source)
+    with _open(source) as img:
+        img = ImageOps.exif_transpose(img)
+        source_width = img.width
+    # Kichik rasmlar kattalashtirilmaydi: eng katta o'lcham asl kenglik bo'ladi
+    target_widths = sorted({min(width, source_width) for width in widths})
+    return [(derivative_name(source_sha, width, ext), width, ext)
+            for width in target_widths for ext in formats]
+
+
+def generate_derivatives(source, source_sha=None, widths=DERIVATIVE_WIDTHS, formats=None, skip=None):
+    """
+    Yield (name, data) for each width/format derivative of an image.
+
+    `source` is image bytes or a binary file object (then pass its
+    source_sha, e.g. Download.sha256). `skip(name)` can return True for
+    names that already exist, so their encoding is not repeated.
+    """
+    plan = planned_derivatives(source, source_sha, widths, formats)
+    if skip is not None:
+        plan = [entry for entry in plan if not skip(entry[0])]
+    if not plan:
+        return
+
+    with _open(source) as img:
+        img = ImageOps.exif_transpose(img)
+        img = img.convert('RGBA' if 'A' in img.getbands() else 'RGB')
+        resized = {}
+        for name, width, ext in plan:
+            if width not in resized:
+                height = max(1, round(img.height * width / img.width))
+                resized[width] = img if width == img.width else img.resize((width, height), Image.LANCZOS)
+            buffer = BytesIO()
+            resized[width].save(buffer, **FORMAT_OPTIONS[ext])
+            yield name, buffer.getvalue()
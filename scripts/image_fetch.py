@@ -0,0 +1,95 @@
+"""
+Concurrent image download stage for the image scripts
+
+Images are fetched by a bounded thread pool that shares one pooled
+session from scripts/http_client.py (keep-alive, retries, timeouts).
+Results are yielded as soon as each download finishes, so a single
+writer (the calling thread) can save them to the models. URLs go through
+http_client.image_host_url, so TOKYO_IMAGE_BASE_URL / --image-base-url
+serve them from a local stand-in server.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from scripts.downloads import stream_download
+from scripts.http_client import image_host_url, make_session
+from scripts.profiling import record
+
+DEFAULT_WORKERS = 8
+
+
+def _fetch(session, url, timeout, cache):
+    if cache is not None:
+        cached = cache.open(url)
+        if cached is not None:
+            return cached
+    started = time.perf_counter()
+    download = None
+    try:
+        download = stream_download(session.get, url, timeout=timeout)
+    finally:
+        # Muvaffaqiyatsiz urinishlar vaqti ham hisobga olinadi
+        record('network', time.perf_counter() - started, download.size if download else 0)
+    if cache is not None:
+        cache.put_download(url, download)
+    return download
+
+
+def fetch_images(jobs, workers=DEFAULT_WORKERS, session=None, timeout=10, cache=None):
+    """
+    Download (key, url) jobs concurrently.
+
+    Yields (key, download, error) tuples in completion order; download is a
+    scripts.downloads.Download (closed once the caller moves on) or None
+    when the download failed and error holds the exception. Jobs sharing a
+    URL are served by a single download.
+    """
+    keys_by_url = {}
+    for key, url in jobs:
+        keys_by_url.setdefault(image_host_url(url), []).append(key)
+    if not keys_by_url:
+        return
+    workers = max(1, min(workers, len(keys_by_url)))
+    session = session or make_session(workers)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_fetch, session, url, timeout, cache): url for url in keys_by_url}
+            for future in as_completed(futures):
+                keys = keys_by_url[futures[future]]
+                try:
+                    download, error = future.result(), None
+                except Exception as e:
+                    download, error = None, e
+                try:
+                    for key in keys:
+                        yield key, download, error
+                finally:
+                    if download is not None:
+                        download.close()
+    finally:
+        if cache is not None:
+            cache.save()
+
+
+def probe_sizes(urls, workers=DEFAULT_WORKERS, session=None, timeout=10):
+    """
+    HEAD each url concurrently and return {url: Content-Length or None}
+    (None when the server does not report a size or the request failed).
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    workers = max(1, min(workers, len(urls)))
+    session = session or make_session(workers)
+
+    def head(url):
+        try:
+            response = session.head(image_host_url(url), allow_redirects=True, timeout=timeout)
+            length = response.headers.get('Content-Length')
+        except Exception:
+            return url, None
+        return url, int(length) if length and length.isdigit() else None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(executor.map(head, urls))
@@ -0,0 +1,127 @@
+"""
+Image source registry: race several URL sources for a search term
+
+A source is a function `source(term) -> url or None`. All registered
+sources are queried concurrently and the first acceptable URL wins; the
+whole race is bounded by `deadline` seconds, so one slow endpoint no
+longer delays every item. Static sources (no I/O, e.g. an in-memory map)
+are checked first, in registration order, before any network source runs.
+
+A network source that raises (transport errors, timeouts, or
+SourceUnavailable for 5xx answers) is remembered in `failure_cache` (a
+scripts.resolve_cache.TTLCache) as "source:<name>" and skipped for every
+term until the entry expires. A source that answers nothing or returns an
+unacceptable URL only misses that term: "miss:<name>:<term>" skips it for
+the same term alone.
+
+    sources = ImageSourceRegistry(failure_cache=resolve_cache)
+    sources.register('static', lookup_static, static=True)
+    sources.register('foodish', foodish)
+    url = sources.resolve('pizza')
+"""
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import threading
+import time
+
+DEFAULT_DEADLINE = 6  # seconds for the whole race
+DEFAULT_FAILURE_TTL = 3600
+DEFAULT_MAX_WORKERS = 16
+
+
+class SourceUnavailable(Exception):
+    """Raised by a source when the service itself is failing (e.g. HTTP 5xx)"""
+
+
+class ImageSourceRegistry:
+    """Named image URL sources raced against a deadline"""
+
+    def __init__(self, deadline=DEFAULT_DEADLINE, failure_cache=None, failure_ttl=DEFAULT_FAILURE_TTL,
+                 max_workers=DEFAULT_MAX_WORKERS):
+        self.deadline = deadline
+        self.failure_cache = failure_cache
+        self.failure_ttl = failure_ttl
+        self._static = []
+        self._network = []
+        self._max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def register(self, name, source, static=False, accept=None):
+        """
+        Add a source. `static=True` marks sources without I/O; they are
+        tried first, one by one. `accept(url)` can reject a source's answer.
+        """
+        entry = (name, source, accept)
+        (self._static if static else self._network).append(entry)
+
+    def unregister(self, name):
+        self._static = [entry for entry in self._static if entry[0] != name]
+        self._network = [entry for entry in self._network if entry[0] != name]
+
+    def names(self):
+        return [entry[0] for entry in self._static + self._network]
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                    thread_name_prefix='image-source')
+            return self._executor
+
+    def _is_failed(self, name, term):
+        return self.failure_cache is not None and (self.failure_cache.contains(f"source:{name}")
+                                                   or self.failure_cache.contains(f"miss:{name}:{term}"))
+
+    def _mark_failed(self, name):
+        if self.failure_cache is not None:
+            self.failure_cache.set(f"source:{name}", None, self.failure_ttl)
+
+    def _mark_miss(self, name, term):
+        if self.failure_cache is not None:
+            self.failure_cache.set(f"miss:{name}:{term}", None, self.failure_ttl)
+
+    def _query(self, name, source, accept, term):
+        # Kechikib kelgan xatolik ham manbani vaqtincha o'chiradi
+        try:
+            url = source(term)
+        except Exception:
+            self._mark_failed(name)
+            return name, None
+        if not url or (accept is not None and not accept(url)):
+            # Manba ishlayapti, faqat shu so'z uchun javobi yo'q
+            self._mark_miss(name, term)
+            return name, None
+        return name, url
+
+    def resolve(self, term, deadline=None):
+        """Return (source_name, url) of the first acceptable answer, or (None, None)"""
+        for name, source, accept in self._static:
+            url = source(term)
+            if url and (accept is None or accept(url)):
+                return name, url
+
+        candidates = [entry for entry in self._network if not self._is_failed(entry[0], term)]
+        if not candidates:
+            return None, None
+
+        executor = self._get_executor()
+        pending = {executor.submit(self._query, name, source, accept, term)
+                   for name, source, accept in candidates}
+        ends_at = time.monotonic() + (self.deadline if deadline is None else deadline)
+        while pending:
+            remaining = ends_at - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, url = future.result()
+                if url:
+                    # Qolgan so'rovlar fonda tugaydi, natijasi e'tiborsiz qoldiriladi
+                    return name, url
+        return None, None
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
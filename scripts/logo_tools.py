@@ -0,0 +1,99 @@
+"""
+Image helpers shared by the create_logo_* scripts (NumPy based)
+"""
+import numpy as np
+from PIL import Image
+
+
+def remove_green_background(img, threshold=100):
+    """
+    Make green-dominant pixels transparent (g > r, g > b and g > threshold).
+
+    The mask is built with array comparisons in one pass and the RGBA result
+    is written with a single Image.fromarray call.
+    """
+    data = np.array(img.convert('RGBA'))
+    r, g, b = data[:, :, 0], data[:, :, 1], data[:, :, 2]
+    mask = (g > r) & (g > b) & (g > threshold)
+    data[mask] = 0
+    return Image.fromarray(data, 'RGBA')
+
+
+def dominant_colors(img, top_k=10, quantize_bits=8, max_pixels=None):
+    """
+    Return (colors, counts) for the top_k most frequent colors, most frequent first.
+
+    RGB is packed into one uint32 per pixel and counted with np.bincount, so
+    the cost is linear in the number of pixels (no sorting of the pixel
+    array). quantize_bits < 8 merges near-identical shades into one bin and
+    reports the bin centre; max_pixels samples large inputs down first.
+    """
+    img = img.convert('RGB')
+    if max_pixels and img.width * img.height > max_pixels:
+        # NEAREST sampling keeps original colors (no blending at the edges)
+        scale = (max_pixels / float(img.width * img.height)) ** 0.5
+        img = img.resize((max(1, int(img.width * scale)), max(1, int(img.height * scale))), Image.NEAREST)
+
+    data = np.asarray(img)
+    shift = 8 - quantize_bits
+    # intp: np.bincount would otherwise make its own int64 copy
+    r, g, b = (data[:, :, i].astype(np.intp) >> shift for i in range(3))
+    packed = (r << (2 * quantize_bits)) | (g << quantize_bits) | b
+
+    counts = np.bincount(packed.ravel())
+    # Tanlov faqat bo'sh bo'lmagan bin'lar orasida (16M bin bo'ylab emas)
+    present = np.flatnonzero(counts)
+    k = min(top_k, len(present))
+    top = present[np.argpartition(counts[present], -k)[-k:]]
+    top = top[np.argsort(counts[top])[::-1]]
+
+    mask = (1 << quantize_bits) - 1
+    colors = np.stack([(top >> (2 * quantize_bits)) & mask, (top >> quantize_bits) & mask, top & mask], axis=1)
+    if shift:
+        colors = (colors << shift) + (1 << (shift - 1))
+    return colors.astype(np.uint8), counts[top]
+
+
+def tolerance_range(color, tolerance):
+    """(min_rgb, max_rgb) of the colors with |channel - color| < tolerance"""
+    return (tuple(max(0, int(c) - tolerance + 1) for c in color),
+            tuple(min(255, int(c) + tolerance - 1) for c in color))
+
+
+def find_color_bboxes(img, ranges):
+    """
+    Bounding boxes (xmin, ymin, xmax, ymax) for several inclusive
+    (min_rgb, max_rgb) color ranges at once; None where nothing matches.
+
+    Each channel gets a 256-entry lookup table whose bit k is set when the
+    value is inside range k, so one pass of three table lookups and two ANDs
+    labels every pixel against all candidates (up to 64 per pass).
+    """
+    data = np.asarray(img.convert('RGB')) if isinstance(img, Image.Image) else np.asarray(img)[:, :, :3]
+    values = np.arange(256)
+    bboxes = []
+
+    for start in range(0, len(ranges), 64):
+        chunk = ranges[start:start + 64]
+        dtype = next(t for t in (np.uint8, np.uint16, np.uint32, np.uint64) if np.iinfo(t).bits >= len(chunk))
+        luts = np.zeros((3, 256), dtype=dtype)
+        for k, (min_rgb, max_rgb) in enumerate(chunk):
+            bit = dtype(1 << k)
+            for c in range(3):
+                luts[c, (values >= min_rgb[c]) & (values <= max_rgb[c])] |= bit
+
+        labels = luts[0][data[:, :, 0]] & luts[1][data[:, :, 1]] & luts[2][data[:, :, 2]]
+        # Qator va ustunlar bo'yicha qaysi ranglar uchragani (bitlar birlashmasi)
+        row_bits = np.bitwise_or.reduce(labels, axis=1)
+        col_bits = np.bitwise_or.reduce(labels, axis=0)
+
+        for k in range(len(chunk)):
+            bit = dtype(1 << k)
+            rows = np.flatnonzero(row_bits & bit)
+            if not len(rows):
+                bboxes.append(None)
+                continue
+            cols = np.flatnonzero(col_bits & bit)
+            bboxes.append((int(cols[0]), int(rows[0]), int(cols[-1]), int(rows[-1])))
+
+    return bboxes
@@ -0,0 +1,57 @@
+"""
+Helpers for saving downloaded images into Django model image fields
+"""
+import os
+import time
+
+from django.core.files import File
+from django.core.files.base import ContentFile
+
+from scripts.image_derivatives import generate_derivatives
+from scripts.profiling import record
+
+DERIVATIVES_DIR = 'derivatives'
+
+EXTENSIONS = {'image/jpeg': 'jpg', 'image/png': 'png', 'image/webp': 'webp', 'image/gif': 'gif', 'image/avif': 'avif'}
+
+
+def save_derivatives(storage, source, source_sha=None):
+    """Store the responsive WebP/AVIF derivatives of an image; returns their names"""
+    def path(name):
+        return os.path.join(DERIVATIVES_DIR, name)
+
+    saved = []
+    for name, data in generate_derivatives(source, source_sha, skip=lambda name: storage.exists(path(name))):
+        started = time.perf_counter()
+        saved.append(storage.save(path(name), ContentFile(data)))
+        record('storage', time.perf_counter() - started, len(data))
+    return saved
+
+
+def save_image_download(instance, download, field_name='image', derivatives=True):
+    """
+    Save a scripts.downloads.Download to instance.<field_name> under a
+    content-hashed name.
+
+    Identical images end up in one file: if the same content is already in
+    storage, the field just points at the existing file. Responsive
+    derivatives are written next to it under MEDIA_ROOT/derivatives/.
+    """
+    field = getattr(instance, field_name)
+    ext = EXTENSIONS.get(download.content_type, 'jpg')
+    filename = f"{download.sha256[:16]}.{ext}"
+    name = field.field.generate_filename(instance, filename)
+
+    if field.storage.exists(name):
+        field.name = name
+        instance.save(update_fields=[field_name])
+    else:
+        # Fayl diskdagi vaqtinchalik fayldan bo'laklab ko'chiriladi
+        download.file.seek(0)
+        started = time.perf_counter()
+        field.save(filename, File(download.file), save=True)
+        record('storage', time.perf_counter() - started, download.size)
+
+    if derivatives:
+        save_derivatives(field.storage, download.file, download.sha256)
+    return field.name
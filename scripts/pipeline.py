@@ -0,0 +1,84 @@
+"""
+Minimal multi-stage worker-pool pipeline
+
+Stages are connected by bounded queues and each stage has its own number
+of worker threads. A stage function receives a job (a dict), updates it
+and returns True to pass it on to the next stage, or False to finish it
+early (e.g. after setting job['error']). Every finished job is yielded
+back to the caller in completion order. `jobs` may be a lazy generator;
+if it raises, the error is re-raised to the caller once the jobs already
+queued have finished.
+
+    for job in run_pipeline(jobs, [('resolve', resolve, 4), ('upload', upload, 2)]):
+        ...
+"""
+import queue
+import threading
+
+DEFAULT_QUEUE_SIZE = 16
+
+_STOP = object()
+
+
+def run_pipeline(jobs, stages, queue_size=DEFAULT_QUEUE_SIZE):
+    """Run jobs through (name, func, workers) stages and yield finished jobs"""
+    queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+    results = queue.Queue()
+    alive = [workers for _, _, workers in stages]
+    lock = threading.Lock()
+    feed_errors = []
+
+    def finish_stage(index):
+        # Bosqichning oxirgi ishchisi keyingi bosqichni to'xtatadi
+        if index + 1 < len(stages):
+            for _ in range(stages[index + 1][2]):
+                queues[index + 1].put(_STOP)
+        else:
+            results.put(_STOP)
+
+    def worker(index):
+        name, func, _ = stages[index]
+        while True:
+            job = queues[index].get()
+            if job is _STOP:
+                break
+            try:
+                passed = func(job)
+            except Exception as e:
+                job['error'] = f"{name}: {e}"
+                passed = False
+            if passed and index + 1 < len(stages):
+                queues[index + 1].put(job)
+            else:
+                job.setdefault('stage', name)
+                results.put(job)
+        with lock:
+            alive[index] -= 1
+            last = alive[index] == 0
+        if last:
+            finish_stage(index)
+
+    def feeder():
+        try:
+            for job in jobs:
+                queues[0].put(job)
+        except Exception as e:
+            feed_errors.append(e)
+        finally:
+            for _ in range(stages[0][2]):
+                queues[0].put(_STOP)
+
+    threads = [threading.Thread(target=feeder, daemon=True)]
+    for index, (_, _, workers) in enumerate(stages):
+        threads += [threading.Thread(target=worker, args=(index,), daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    while True:
+        job = results.get()
+        if job is _STOP:
+            break
+        yield job
+
+    if feed_errors:
+        raise feed_errors[0]
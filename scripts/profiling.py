@@ -0,0 +1,133 @@
+"""
+Per-phase instrumentation for the data scripts (--profile)
+
+    with RunProfile() as profile:
+        with phase('categories'):
+            ...
+    profile.write('-')      # JSON summary to stdout (or a file path)
+
+While a profile is active every phase records its wall time, the number
+and total time of ORM queries (connection.execute_wrapper), and the
+network / storage time and bytes reported through record(). Network
+time is summed over the download threads, so it can exceed the phase's
+wall time. Without an active profile phase() and record() do nothing,
+so the scripts call them unconditionally.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from scripts.image_cache import write_atomic
+
+PROFILE_VERSION = 1
+
+_active = None
+
+
+def _empty_phase():
+    return {'wall_time': 0.0, 'queries': 0, 'query_time': 0.0,
+            'network_time': 0.0, 'network_bytes': 0, 'downloads': 0,
+            'storage_time': 0.0, 'storage_bytes': 0, 'storage_writes': 0}
+
+
+class RunProfile:
+    """Counters for each named phase of one script run"""
+
+    def __init__(self, script=None):
+        self.script = script or sys.argv[0]
+        self.phases = {}
+        self.current = None
+        self._lock = threading.Lock()
+        self._started = None
+        self._wall_time = 0.0
+        self._wrapper = None
+
+    def __enter__(self):
+        from django.db import connection
+
+        global _active
+        _active = self
+        # Bosqichdan tashqaridagi so'rovlar "other" ga yoziladi
+        self._wrapper = connection.execute_wrapper(self._query_wrapper)
+        self._wrapper.__enter__()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        self._wall_time = time.perf_counter() - self._started
+        self._wrapper.__exit__(*exc)
+        _active = None
+
+    def _phase(self, name=None):
+        return self.phases.setdefault(name or self.current or 'other', _empty_phase())
+
+    def add(self, kind, seconds, nbytes=0, name=None):
+        """Add network/storage time and bytes to a phase (thread-safe)"""
+        counter = 'downloads' if kind == 'network' else 'storage_writes'
+        with self._lock:
+            phase = self._phase(name)
+            phase[f'{kind}_time'] += seconds
+            phase[f'{kind}_bytes'] += nbytes
+            phase[counter] += 1
+
+    def _query_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            with self._lock:
+                phase = self._phase()
+                phase['queries'] += 1
+                phase['query_time'] += time.perf_counter() - started
+
+    def summary(self):
+        totals = _empty_phase()
+        for phase in self.phases.values():
+            for key, value in phase.items():
+                totals[key] += value
+        totals['wall_time'] = self._wall_time or totals['wall_time']
+        rounded = lambda values: {key: round(value, 4) if isinstance(value, float) else value
+                                  for key, value in values.items()}
+        return {
+            'version': PROFILE_VERSION,
+            'script': self.script,
+            'finished_at': datetime.now(timezone.utc).isoformat(),
+            'phases': {name: rounded(values) for name, values in self.phases.items()},
+            'totals': rounded(totals),
+        }
+
+    def write(self, path='-'):
+        """Write the JSON summary to path ('-' for stdout)"""
+        data = json.dumps(self.summary(), ensure_ascii=False, indent=2)
+        if path == '-':
+            print(data)
+        else:
+            write_atomic(os.path.abspath(path), (data + '\n').encode('utf-8'))
+
+
+@contextmanager
+def phase(name):
+    """Attribute queries, network and storage work inside the block to `name`"""
+    profile = _active
+    if profile is None:
+        yield
+        return
+    previous, profile.current = profile.current, name
+    profile._phase(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile._phase(name)['wall_time'] += time.perf_counter() - started
+        profile.current = previous
+
+
+def record(kind, seconds, nbytes=0):
+    """Report network ('network') or storage ('storage') work to the active profile"""
+    if _active is not None:
+        _active.add(kind, seconds, nbytes)
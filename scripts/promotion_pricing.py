@@ -0,0 +1,199 @@
+"""
+Materialized promotion pricing table
+
+For every active promotion the effective price is computed once per
+linked menu item: the `linked_product`, or every item of the promotion's
+category. A promotion with its own `price` and no links gets one row
+with item None. Each row carries the promotion's validity window, so
+readers drop it at `end_date` without recomputing anything:
+
+    {"version": 1, "fingerprint": "...", "built_at": "...", "expires_at": "...",
+     "rows": [{"promotion": 3, "item": 12, "price": "45000.00",
+               "discounted_price": "30150.00", "discount_display": "-33%",
+               "starts_at": "...", "ends_at": "..."}, ...]}
+
+`fingerprint` hashes every input the prices depend on; the table is only
+rebuilt when it changes or when `expires_at` (the next start/end boundary)
+has passed. Dates without a time (and naive datetimes) are local to `tz`,
+the backend's TIME_ZONE, so a promotion ending on a date ends at local
+midnight.
+"""
+import hashlib
+import json
+import os
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_UP
+
+from scripts.image_cache import write_atomic
+
+PRICING_TABLE_VERSION = 1
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'public', 'promotion-pricing.json')
+PRICE_STEP = Decimal('0.01')
+
+PROMOTION_FIELDS = ('id', 'discount_type', 'discount_percentage', 'discount_amount', 'price',
+                    'start_date', 'end_date', 'is_active', 'linked_product_id', 'linked_dish_id',
+                    'promotion_category_id', 'category_id')
+
+# Seed ma'lumotlari va frontend turli nomlardan foydalanadi
+DISCOUNT_TYPES = {
+    'percentage': 'percent',
+    'percent': 'percent',
+    'fixed': 'amount',
+    'amount': 'amount',
+}
+
+
+def _decimal(value):
+    return Decimal(str(value)) if value not in (None, '') else None
+
+
+def _as_datetime(value, end=False, tz=timezone.utc):
+    """
+    date / datetime / ISO string -> aware UTC datetime. Dates and naive
+    datetimes are local to `tz`; a date `end` covers the whole day.
+    """
+    if value in (None, ''):
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value) if 'T' in value or ' ' in value else date.fromisoformat(value)
+    if not isinstance(value, datetime):
+        value = datetime.combine(value + timedelta(days=1) if end else value, dt_time.min)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=tz)
+    return value.astimezone(timezone.utc)
+
+
+def discount_type(promotion):
+    return DISCOUNT_TYPES.get(promotion.get('discount_type'), promotion.get('discount_type'))
+
+
+def discounted_price(price, promotion):
+    """Effective price after the promotion's discount (never below zero)"""
+    price = _decimal(price)
+    kind = discount_type(promotion)
+    if kind == 'percent' and promotion.get('discount_percentage'):
+        price = price * (100 - _decimal(promotion['discount_percentage'])) / 100
+    elif kind == 'amount' and promotion.get('discount_amount'):
+        price = price - _decimal(promotion['discount_amount'])
+    return max(price, Decimal(0)).quantize(PRICE_STEP, rounding=ROUND_HALF_UP)
+
+
+def discount_display(promotion):
+    """Badge text, same as getDiscountDisplay() in components/promotion-modal.tsx"""
+    kind = discount_type(promotion)
+    if kind == 'percent' and promotion.get('discount_percentage'):
+        return f"-{_decimal(promotion['discount_percentage']).normalize():f}%"
+    if kind == 'amount' and promotion.get('discount_amount'):
+        amount = int(_decimal(promotion['discount_amount']).to_integral_value(ROUND_HALF_UP))
+        return f"-{amount:,} so'm".replace(',', ' ')
+    if kind == 'bonus':
+        return "Bonus"
+    return "Aksiya"
+
+
+def linked_items(promotion, items, items_by_category):
+    """Menu items the promotion applies to"""
+    # linked_dish - eski nom (frontend'dagi "Legacy fields")
+    product_id = promotion.get('linked_product_id') or promotion.get('linked_dish_id')
+    if product_id:
+        item = items.get(product_id)
+        return [item] if item else []
+    category_id = promotion.get('promotion_category_id') or promotion.get('category_id')
+    return items_by_category.get(category_id, []) if category_id else []
+
+
+def inputs_fingerprint(promotions, items, tz=timezone.utc):
+    """Hash of everything the table depends on (promotions, item prices, time zone)"""
+    payload = json.dumps([sorted(promotions, key=lambda p: p['id']),
+                          sorted(items, key=lambda i: i['id']), str(tz)],
+                         sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def build_pricing_table(promotions, items, now=None, tz=timezone.utc):
+    """Build the pricing table dict from promotion and menu item dicts"""
+    promotions = list(promotions)
+    items = list(items)
+    now = now or datetime.now(timezone.utc)
+    by_id = {item['id']: item for item in items}
+    by_category = {}
+    for item in items:
+        by_category.setdefault(item.get('category_id'), []).append(item)
+
+    rows = []
+    boundaries = []
+    for promotion in promotions:
+        starts_at = _as_datetime(promotion.get('start_date'), tz=tz)
+        ends_at = _as_datetime(promotion.get('end_date'), end=True, tz=tz)
+        if not promotion.get('is_active', True) or (ends_at and ends_at <= now):
+            continue
+        boundaries += [moment for moment in (starts_at, ends_at) if moment and moment > now]
+
+        targets = [(item['id'], item['price']) for item in linked_items(promotion, by_id, by_category)]
+        if not targets and promotion.get('price') not in (None, ''):
+            targets = [(None, promotion['price'])]
+        display = discount_display(promotion)
+        for item_id, price in targets:
+            rows.append({
+                'promotion': promotion['id'],
+                'item': item_id,
+                'price': str(_decimal(price).quantize(PRICE_STEP)),
+                'discounted_price': str(discounted_price(price, promotion)),
+                'discount_display': display,
+                'starts_at': starts_at.isoformat() if starts_at else None,
+                'ends_at': ends_at.isoformat() if ends_at else None,
+            })
+
+    return {
+        'version': PRICING_TABLE_VERSION,
+        'fingerprint': inputs_fingerprint(promotions, items, tz),
+        'built_at': now.isoformat(),
+        'expires_at': min(boundaries).isoformat() if boundaries else None,
+        'rows': rows,
+    }
+
+
+def current_rows(table, now=None):
+    """Rows whose promotion is running at `now`"""
+    now = now or datetime.now(timezone.utc)
+    return [row for row in table['rows']
+            if (not row['starts_at'] or _as_datetime(row['starts_at']) <= now)
+            and (not row['ends_at'] or now < _as_datetime(row['ends_at']))]
+
+
+def load_pricing_table(path):
+    """Return the table stored at path, or None if missing, unreadable or outdated"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            table = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return table if table.get('version') == PRICING_TABLE_VERSION else None
+
+
+def needs_refresh(table, fingerprint, now=None):
+    if table is None or table.get('fingerprint') != fingerprint:
+        return True
+    now = now or datetime.now(timezone.utc)
+    return bool(table.get('expires_at')) and _as_datetime(table['expires_at']) <= now
+
+
+def refresh_pricing_file(promotion_model, menu_item_model, path=DEFAULT_OUTPUT, force=False):
+    """
+    Rebuild the pricing file from the database if its inputs changed or a
+    promotion started / ended since it was built. Returns True if written.
+    """
+    from django.utils import timezone as django_timezone
+
+    tz = django_timezone.get_default_timezone()
+    fields = [name for name in PROMOTION_FIELDS
+              if name in {field.attname for field in promotion_model._meta.concrete_fields}]
+    promotions = list(promotion_model.objects.values(*fields))
+    items = list(menu_item_model.objects.values('id', 'category_id', 'price'))
+
+    if not force and not needs_refresh(load_pricing_table(path), inputs_fingerprint(promotions, items, tz)):
+        return False
+    table = build_pricing_table(promotions, items, tz=tz)
+    write_atomic(os.path.abspath(path), json.dumps(table, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    return True
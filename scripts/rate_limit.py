@@ -0,0 +1,88 @@
+"""
+Per-host token-bucket rate limiting with adaptive backoff
+
+Each host gets its own requests-per-second budget. When a host answers
+429 or 5xx its rate is halved (and Retry-After is honoured); successful
+responses slowly raise the rate back to the configured budget.
+"""
+import threading
+import time
+from urllib.parse import urlsplit
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, up to `capacity` tokens"""
+
+    def __init__(self, rate, capacity=None):
+        self.base_rate = float(rate)
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a token is available"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """Keeps one TokenBucket per host and adapts it to server responses"""
+
+    def __init__(self, default_rps=10, host_rps=None, min_rps=0.2, max_backoff=60):
+        self.default_rps = default_rps
+        self.host_rps = dict(host_rps or {})
+        self.min_rps = min_rps
+        self.max_backoff = max_backoff
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url):
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.host_rps.get(host, self.default_rps))
+            return self._buckets[host]
+
+    def wait(self, url):
+        """Wait for this host's budget before sending a request"""
+        self.bucket(url).acquire()
+
+    def feedback(self, url, status_code, retry_after=None):
+        """Adapt the host's rate to the response status"""
+        bucket = self.bucket(url)
+        with bucket.lock:
+            if status_code in RETRY_STATUSES:
+                # Server band: tezlikni ikki baravar kamaytiramiz
+                bucket.rate = max(self.min_rps, bucket.rate / 2)
+                delay = _parse_retry_after(retry_after)
+                if delay is None:
+                    delay = 1 / bucket.rate
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + min(delay, self.max_backoff))
+            elif bucket.rate < bucket.base_rate:
+                bucket.rate = min(bucket.base_rate, bucket.rate + bucket.base_rate * 0.1)
+
+
+def _parse_retry_after(value):
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        # HTTP-date ko'rinishidagi qiymatlar uchun standart kutish ishlatiladi
+        return None
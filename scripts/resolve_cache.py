@@ -0,0 +1,58 @@
+"""
+Persistent key -> value cache with per-entry TTL
+
+Used to remember which image URL a search term resolved to, and which
+image sources recently failed (negative entries store None), so identical
+terms and dead endpoints are not retried on every item or every run.
+
+    TOKYO_RESOLVE_CACHE   cache file (default ~/.cache/tokyo/resolve.json)
+"""
+import json
+import os
+import threading
+import time
+
+from scripts.image_cache import write_atomic
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'tokyo', 'resolve.json')
+
+_MISSING = object()
+
+
+class TTLCache:
+    """JSON-file backed cache; get() returns `default` for missing or expired keys"""
+
+    def __init__(self, path=None):
+        self.path = path or os.environ.get('TOKYO_RESOLVE_CACHE') or DEFAULT_CACHE_PATH
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def get(self, key, default=_MISSING):
+        """Return the cached value (which may be None for a negative entry)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry['expires'] < time.time():
+                del self._entries[key]
+                return default
+            return entry['value']
+
+    def contains(self, key):
+        return self.get(key) is not _MISSING
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = {'value': value, 'expires': time.time() + ttl}
+
+    def save(self):
+        """Drop expired entries and write the cache file atomically"""
+        now = time.time()
+        with self._lock:
+            self._entries = {k: v for k, v in self._entries.items() if v['expires'] >= now}
+            data = json.dumps(self._entries, ensure_ascii=False).encode('utf-8')
+        write_atomic(self.path, data)
@@ -0,0 +1,101 @@
+"""
+Dry-run cost report for the seeding and image scripts (--plan)
+
+A script fills a RunPlan from one read of the current state (which rows
+would be created or updated, which images downloaded) and prints it
+instead of writing anything. Query counts are estimates that follow how
+the scripts write: one read per model, bulk_create / bulk_update in
+batches (or one query per row for scripts that save rows one by one),
+one UPDATE per saved image.
+"""
+import math
+
+from scripts.image_derivatives import DERIVATIVE_WIDTHS, output_formats
+from scripts.http_client import image_host_url
+from scripts.image_fetch import DEFAULT_WORKERS, probe_sizes
+
+
+def _format_bytes(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class RunPlan:
+    """Pending writes, downloads and transfer volume of one script run"""
+
+    def __init__(self, title, batch_size=500):
+        self.title = title
+        self.batch_size = batch_size
+        self.rows = []
+        self.images = []
+        self.reads = 0
+
+    def add_rows(self, label, plan, reads=1, per_row=False):
+        """
+        Add a seed_utils.plan_rows() result found with `reads` queries.
+        `per_row` means the script saves rows one by one (one query each)
+        instead of writing them in batches.
+        """
+        self.reads += reads
+        self.rows.append((label, plan, per_row))
+
+    def add_images(self, label, jobs, cache=None, workers=DEFAULT_WORKERS, probe=True, reads=1):
+        """
+        Add (key, url) image jobs found with `reads` queries. URLs already
+        in `cache` cost no transfer; the size of the others is taken from a
+        HEAD request when `probe`.
+        """
+        self.reads += reads
+        urls = list(dict.fromkeys(image_host_url(url) for _, url in jobs))
+        cached = {url: cache.cached_size(url) for url in urls} if cache is not None else {}
+        missing = [url for url in urls if cached.get(url) is None]
+        sizes = probe_sizes(missing, workers) if probe else {}
+        self.images.append({
+            'label': label,
+            'saves': len(jobs),
+            'downloads': len(missing),
+            'cached': len(urls) - len(missing),
+            'bytes': sum(size for size in sizes.values() if size),
+            'unknown': sum(1 for url in missing if not sizes.get(url)),
+        })
+
+    def queries(self):
+        """Estimated number of database queries (reads + writes)"""
+        total = self.reads
+        for _, plan, per_row in self.rows:
+            batch_size = 1 if per_row else self.batch_size
+            total += math.ceil(plan['create'] / batch_size)
+            total += sum(math.ceil(count / batch_size) for count in plan['update'].values())
+        # Har bir rasm: storage tekshiruvi + bitta UPDATE
+        total += sum(images['saves'] for images in self.images)
+        return total
+
+    def report(self):
+        print("=" * 60)
+        print(f"📋 Plan: {self.title} (dry run, nothing written)")
+        print("=" * 60)
+        for label, plan, _ in self.rows:
+            updates = sum(plan['update'].values())
+            print(f"  {label}: {plan['create']} to create, {updates} to update, {plan['unchanged']} unchanged")
+            for fields, count in sorted(plan['update'].items()):
+                print(f"    🔄 {count} × {', '.join(fields)}")
+
+        derivatives = len(DERIVATIVE_WIDTHS) * len(output_formats())
+        transfer = unknown = 0
+        for images in self.images:
+            transfer += images['bytes']
+            unknown += images['unknown']
+            print(f"  {images['label']}: {images['saves']} images to save, {images['downloads']} downloads "
+                  f"({images['cached']} cached), ~{_format_bytes(images['bytes'])}"
+                  + (f" + {images['unknown']} of unknown size" if images['unknown'] else ""))
+        if self.images:
+            saves = sum(images['saves'] for images in self.images)
+            print(f"  Storage writes: up to {saves} images + {saves * derivatives} derivatives")
+
+        print(f"  Estimated queries: {self.queries()}")
+        if self.images:
+            print(f"  Expected download: ~{_format_bytes(transfer)}"
+                  + (f" (+ {unknown} files of unknown size)" if unknown else ""))
+        print("=" * 60)
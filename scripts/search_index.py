@@ -0,0 +1,129 @@
+"""
+Multilingual menu search index (uz Latin / uz Cyrillic / ru / en)
+
+Every word of an item's names and ingredients (descriptions are left out
+to keep the artifact small) is normalized (scripts/food_terms.normalize),
+transliterated from Cyrillic to Uzbek Latin and indexed under each of its
+prefixes of MIN_PREFIX..MAX_PREFIX letters; purely numeric words are
+skipped. A query is normalized the same way, so "shashlik", "шашлык" and
+"шаш" all hit the same entries, and each query word is answered with a
+single dict lookup.
+
+Artifact (compact JSON, `version` bumps when the layout changes):
+
+    {"version": 2, "items": [[id, category_id], ...],
+     "prefixes": {"shash": [0, 4, 1], ...}}
+
+Posting lists hold positions in `items`, delta-encoded: the first number
+is a position, every next one the gap to the previous position
+([0, 4, 1] -> positions 0, 4, 5).
+"""
+import json
+import re
+from itertools import accumulate
+
+from scripts.food_terms import normalize
+from scripts.image_cache import write_atomic
+
+SEARCH_INDEX_VERSION = 2
+MIN_PREFIX = 2
+MAX_PREFIX = 12
+
+TEXT_FIELDS = ('name', 'name_uz', 'name_ru')
+LIST_FIELDS = ('ingredients', 'ingredients_uz', 'ingredients_ru')
+
+_WORD_RE = re.compile(r"\w+")
+
+# O'zbek kirill -> lotin (rus harflari ham shu jadval bilan o'giriladi)
+CYRILLIC_TO_LATIN = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'ғ': 'g', 'д': 'd', 'е': 'e', 'ё': 'yo',
+    'ж': 'j', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'қ': 'q', 'л': 'l', 'м': 'm',
+    'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u', 'ў': 'o',
+    'ф': 'f', 'х': 'x', 'ҳ': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sh', 'ъ': '',
+    'ы': 'i', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+}
+_TRANSLIT_TABLE = str.maketrans(CYRILLIC_TO_LATIN)
+
+
+def transliterate(word):
+    """Cyrillic -> Uzbek Latin; Latin words are returned unchanged"""
+    return word.translate(_TRANSLIT_TABLE)
+
+
+def index_words(text):
+    """Normalized, transliterated words of a text (numbers are skipped)"""
+    return [transliterate(word) for word in _WORD_RE.findall(normalize(text)) if not word.isdigit()]
+
+
+def prefixes(word):
+    return {word[:length] for length in range(MIN_PREFIX, min(len(word), MAX_PREFIX) + 1)}
+
+
+def item_words(item):
+    """All indexable words of a menu item dict"""
+    words = set()
+    for field in TEXT_FIELDS:
+        if item.get(field):
+            words.update(index_words(item[field]))
+    for field in LIST_FIELDS:
+        for value in item.get(field) or ():
+            words.update(index_words(value))
+    return words
+
+
+def build_search_index(items):
+    """Build the index artifact dict from menu item dicts (with 'id' and 'category_id')"""
+    entries = []
+    postings = {}
+    for position, item in enumerate(items):
+        entries.append([item['id'], item.get('category_id')])
+        keys = set()
+        for word in item_words(item):
+            keys.update(prefixes(word))
+        for key in keys:
+            postings.setdefault(key, []).append(position)
+    return {
+        'version': SEARCH_INDEX_VERSION,
+        'items': entries,
+        'prefixes': {key: delta_encode(positions) for key, positions in sorted(postings.items())},
+    }
+
+
+def delta_encode(positions):
+    """Ascending positions -> first position followed by the gaps"""
+    return [position - previous for previous, position in zip([0] + positions, positions)]
+
+
+def delta_decode(deltas):
+    return accumulate(deltas)
+
+
+def dump_search_index(index, path):
+    """Write the index as compact UTF-8 JSON; returns its size in bytes"""
+    data = json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    write_atomic(path, data)
+    return len(data)
+
+
+def load_search_index(path):
+    with open(path, encoding='utf-8') as f:
+        index = json.load(f)
+    if index.get('version') != SEARCH_INDEX_VERSION:
+        raise ValueError(f"Unsupported search index version: {index.get('version')}")
+    return index
+
+
+def search(index, query, category_id=None):
+    """Ids of items matching every word of the query (as a prefix), in index order"""
+    words = [word for word in index_words(query) if len(word) >= MIN_PREFIX]
+    if not words:
+        return []
+    matches = None
+    for word in words:
+        positions = set(delta_decode(index['prefixes'].get(word[:MAX_PREFIX], ())))
+        matches = positions if matches is None else matches & positions
+        if not matches:
+            return []
+    items = index['items']
+    return [items[position][0] for position in sorted(matches)
+            if category_id is None or items[position][1] == category_id]
@@ -0,0 +1,75 @@
+"""
+Streaming loader for seed data files (JSON Lines or CSV)
+
+Each file is read one record at a time, so catalogs with tens of thousands
+of rows are imported without building the whole list in memory.
+
+File layout of a data directory (see seed_data/tokyo/):
+    categories.jsonl | categories.csv
+    menu_items.jsonl | menu_items.csv    ("category" column = category name)
+    promotions.jsonl | promotions.csv
+"""
+import csv
+import json
+import os
+
+# CSV'da ro'yxat maydonlari "a|b|c" yoki JSON ko'rinishida yoziladi
+LIST_FIELDS = ('ingredients', 'ingredients_uz', 'ingredients_ru')
+
+
+def find_data_file(data_dir, name):
+    """Return the .jsonl or .csv file for a dataset, or None if missing"""
+    for ext in ('.jsonl', '.csv'):
+        path = os.path.join(data_dir, name + ext)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _parse_csv_row(row):
+    """Convert a CSV row into the same shape as a JSON Lines record"""
+    record = {}
+    for key, value in row.items():
+        if value is None or value == '':
+            # Bo'sh ustunlar modeldagi default qiymatni oladi
+            continue
+        if key in LIST_FIELDS:
+            value = json.loads(value) if value.startswith('[') else [v.strip() for v in value.split('|')]
+        record[key] = value
+    return record
+
+
+def iter_records(path):
+    """Stream records from a .jsonl or .csv file one by one"""
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.endswith('.csv'):
+            for row in csv.DictReader(f):
+                yield _parse_csv_row(row)
+        else:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{path}:{line_no}: invalid JSON ({e})")
+
+
+def category_id_map(category_model):
+    """Build the category name -> id map with a single query"""
+    return dict(category_model.objects.values_list('name', 'id'))
+
+
+def resolve_categories(records, category_ids):
+    """Replace the category name of each record with its category_id"""
+    for record in records:
+        name = record.pop('category', None)
+        if name is None:
+            yield record
+            continue
+        if name not in category_ids:
+            print(f"❌ Unknown category '{name}' for {record.get('name') or record.get('title')}")
+            continue
+        record['category_id'] = category_ids[name]
+        yield record
@@ -0,0 +1,175 @@
+"""
+Helpers for seeding the catalog in bulk (used by create_tokyo_data.py and
+add_images_promotions.py)
+"""
+import datetime
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+
+def existing_keys(model, key_field):
+    """Load all natural keys of a model in one query"""
+    return set(model.objects.values_list(key_field, flat=True))
+
+
+def bulk_create_missing(model, key_field, rows, label, batch_size=500):
+    """
+    Create only the rows whose natural key is not in the database yet.
+
+    Existing keys are loaded with a single query, new rows are written with
+    bulk_create inside one transaction. Returns the number of created rows.
+    """
+    existing = existing_keys(model, key_field)
+    pending = []
+    created = 0
+
+    with transaction.atomic():
+        for row in rows:
+            key = row[key_field]
+            if key in existing:
+                continue
+            # Bir xil nomli qatorlar ikki marta yaratilmasin
+            existing.add(key)
+            pending.append(model(**row))
+            print(f"✅ Created {label}: {key}")
+
+            if len(pending) >= batch_size:
+                model.objects.bulk_create(pending, batch_size=batch_size)
+                created += len(pending)
+                pending = []
+
+        if pending:
+            model.objects.bulk_create(pending, batch_size=batch_size)
+            created += len(pending)
+
+    return created
+
+
+def _canonical(value):
+    """Comparable form of a field value (Decimal('45000.00') == Decimal('45000'))"""
+    if isinstance(value, Decimal):
+        return str(value.normalize())
+    if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+        value = value.astimezone(datetime.timezone.utc)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def changed_fields(incoming, current):
+    """{field: value} pairs of `incoming` that differ from the stored `current` values"""
+    return {name: value for name, value in incoming.items()
+            if _canonical(value) != _canonical(current.get(name))}
+
+
+def _to_python(model, name, value):
+    """Convert an incoming (JSON / CSV) value the way the model field stores it"""
+    value = model._meta.get_field(name).to_python(value)
+    if isinstance(value, datetime.datetime) and settings.USE_TZ and timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def diff_rows(model, key_field, rows, compare=True):
+    """
+    Compare incoming rows with the database without writing anything.
+
+    Stored rows are loaded with one query. Yields ('create', key, row),
+    ('update', key, changed, pk) with the {field: value} pairs that differ,
+    or ('unchanged', key). Only the fields present in the incoming row are
+    compared, column by column. With compare=False existing rows are
+    reported as unchanged without loading their values.
+    """
+    if compare:
+        fields = [field.attname for field in model._meta.concrete_fields
+                  if not field.primary_key and field.get_internal_type() not in ('FileField', 'ImageField')]
+        stored = {values[key_field]: values for values in model.objects.values('pk', *fields)}
+    else:
+        stored = dict.fromkeys(existing_keys(model, key_field), {})
+    created_keys = set()
+
+    for row in rows:
+        key = row[key_field]
+        if key in created_keys:
+            continue
+        current = stored.get(key)
+        if current is None:
+            # Bir xil nomli qatorlar ikki marta yaratilmasin
+            created_keys.add(key)
+            yield 'create', key, row
+            continue
+        if not compare:
+            yield 'unchanged', key
+            continue
+
+        incoming = {name: _to_python(model, name, value) for name, value in row.items()}
+        changed = changed_fields(incoming, current)
+        if changed:
+            yield 'update', key, changed, current['pk']
+        else:
+            yield 'unchanged', key
+
+
+def plan_rows(model, key_field, rows, compare=True):
+    """
+    Count what sync_rows (compare=True) or bulk_create_missing
+    (compare=False) would do: {'create': n, 'update': {fields: n}, 'unchanged': n}
+    """
+    plan = {'create': 0, 'update': {}, 'unchanged': 0}
+    for action, *details in diff_rows(model, key_field, rows, compare):
+        if action == 'update':
+            fields = tuple(sorted(details[1]))
+            plan['update'][fields] = plan['update'].get(fields, 0) + 1
+        else:
+            plan[action] += 1
+    return plan
+
+
+def sync_rows(model, key_field, rows, label, batch_size=500):
+    """
+    Create missing rows and update changed ones, touching only what differs.
+
+    Rows are compared with diff_rows(); new rows are written with
+    bulk_create and updates with bulk_update grouped by the set of changed
+    columns, each flushed every `batch_size` objects. Returns
+    {'created': n, 'updated': n, 'unchanged': n}.
+    """
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+    pending_create = []
+    pending_update = {}
+
+    def flush_update(changed_fields):
+        objs = pending_update.pop(changed_fields)
+        model.objects.bulk_update(objs, changed_fields, batch_size=batch_size)
+        counts['updated'] += len(objs)
+
+    with transaction.atomic():
+        for action, key, *details in diff_rows(model, key_field, rows):
+            if action == 'create':
+                pending_create.append(model(**details[0]))
+                print(f"✅ Created {label}: {key}")
+                if len(pending_create) >= batch_size:
+                    model.objects.bulk_create(pending_create, batch_size=batch_size)
+                    counts['created'] += len(pending_create)
+                    pending_create = []
+            elif action == 'update':
+                changed, pk = details
+                # Har bir o'zgargan ustunlar to'plami uchun alohida UPDATE
+                fields = tuple(sorted(changed))
+                pending_update.setdefault(fields, []).append(model(pk=pk, **changed))
+                print(f"🔄 Updated {label}: {key} ({', '.join(fields)})")
+                if len(pending_update[fields]) >= batch_size:
+                    flush_update(fields)
+            else:
+                counts['unchanged'] += 1
+
+        if pending_create:
+            model.objects.bulk_create(pending_create, batch_size=batch_size)
+            counts['created'] += len(pending_create)
+        for fields in list(pending_update):
+            flush_update(fields)
+
+    return counts
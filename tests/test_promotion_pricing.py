@@ -0,0 +1,97 @@
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+from scripts.promotion_pricing import (build_pricing_table, current_rows, discount_display, discounted_price,
+                                       inputs_fingerprint, needs_refresh)
+
+TASHKENT = ZoneInfo('Asia/Tashkent')
+NOW = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+ITEMS = [
+    {'id': 1, 'category_id': 10, 'price': '45000.00'},
+    {'id': 2, 'category_id': 10, 'price': '30000.00'},
+    {'id': 3, 'category_id': 20, 'price': '12000.00'},
+]
+
+
+def promotion(**fields):
+    return dict({'id': 1, 'discount_type': 'percentage', 'discount_percentage': None, 'discount_amount': None,
+                 'price': None, 'start_date': None, 'end_date': None, 'is_active': True,
+                 'linked_product_id': None, 'category_id': None}, **fields)
+
+
+class DiscountTests(unittest.TestCase):
+    def test_percentage(self):
+        self.assertEqual(discounted_price('45000.00', promotion(discount_percentage=33)), Decimal('30150.00'))
+
+    def test_percentage_rounds_half_up_to_tiyin(self):
+        self.assertEqual(discounted_price('0.05', promotion(discount_percentage=50)), Decimal('0.03'))
+
+    def test_fixed_amount(self):
+        self.assertEqual(discounted_price('30000', promotion(discount_type='fixed', discount_amount='5000')),
+                         Decimal('25000.00'))
+
+    def test_amount_never_below_zero(self):
+        self.assertEqual(discounted_price('3000', promotion(discount_type='amount', discount_amount='5000')),
+                         Decimal('0.00'))
+
+    def test_no_discount_keeps_price(self):
+        self.assertEqual(discounted_price('12000', promotion(discount_type='bonus')), Decimal('12000.00'))
+
+    def test_display(self):
+        self.assertEqual(discount_display(promotion(discount_percentage='15.00')), "-15%")
+        self.assertEqual(discount_display(promotion(discount_type='fixed', discount_amount='15000')), "-15 000 so'm")
+        self.assertEqual(discount_display(promotion(discount_type='bonus')), "Bonus")
+        self.assertEqual(discount_display(promotion()), "Aksiya")
+
+
+class PricingTableTests(unittest.TestCase):
+    def test_rows_for_linked_product_and_category(self):
+        table = build_pricing_table([
+            promotion(id=1, discount_percentage=10, linked_product_id=3),
+            promotion(id=2, discount_type='fixed', discount_amount=1000, category_id=10),
+        ], ITEMS, now=NOW)
+        self.assertEqual([(row['promotion'], row['item'], row['discounted_price']) for row in table['rows']],
+                         [(1, 3, '10800.00'), (2, 1, '44000.00'), (2, 2, '29000.00')])
+
+    def test_own_price_without_links(self):
+        table = build_pricing_table([promotion(discount_percentage=20, price='50000')], ITEMS, now=NOW)
+        self.assertEqual([(row['item'], row['discounted_price']) for row in table['rows']], [(None, '40000.00')])
+
+    def test_inactive_and_ended_promotions_are_dropped(self):
+        table = build_pricing_table([
+            promotion(id=1, discount_percentage=10, linked_product_id=1, is_active=False),
+            promotion(id=2, discount_percentage=10, linked_product_id=1, end_date=date(2026, 4, 30)),
+        ], ITEMS, now=NOW, tz=TASHKENT)
+        self.assertEqual(table['rows'], [])
+
+    def test_date_only_end_is_local_midnight(self):
+        table = build_pricing_table([promotion(discount_percentage=10, linked_product_id=1,
+                                               end_date='2026-05-01')], ITEMS, now=NOW, tz=TASHKENT)
+        ends_at = datetime.fromisoformat(table['rows'][0]['ends_at'])
+        # 2 may 00:00 Toshkent vaqti = 1 may 19:00 UTC
+        self.assertEqual(ends_at, datetime(2026, 5, 1, 19, 0, tzinfo=timezone.utc))
+        self.assertEqual(table['expires_at'], ends_at.isoformat())
+
+    def test_current_rows_follow_the_validity_window(self):
+        table = build_pricing_table([promotion(discount_percentage=10, linked_product_id=1,
+                                               start_date='2026-05-02', end_date='2026-05-03')],
+                                    ITEMS, now=NOW, tz=TASHKENT)
+        self.assertEqual(current_rows(table, NOW), [])
+        self.assertEqual(len(current_rows(table, datetime(2026, 5, 2, 12, 0, tzinfo=timezone.utc))), 1)
+        self.assertEqual(current_rows(table, datetime(2026, 5, 3, 19, 0, tzinfo=timezone.utc)), [])
+
+    def test_needs_refresh(self):
+        promotions = [promotion(discount_percentage=10, linked_product_id=1, end_date='2026-05-03')]
+        table = build_pricing_table(promotions, ITEMS, now=NOW)
+        fingerprint = inputs_fingerprint(promotions, ITEMS)
+        self.assertFalse(needs_refresh(table, fingerprint, NOW))
+        self.assertTrue(needs_refresh(table, inputs_fingerprint(promotions, ITEMS[:2]), NOW))
+        self.assertTrue(needs_refresh(table, fingerprint, NOW + timedelta(days=3)))
+        self.assertTrue(needs_refresh(None, fingerprint, NOW))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import contextlib
+import io
+import unittest
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+try:
+    import django
+    from django.conf import settings
+except ImportError:
+    raise unittest.SkipTest("Django is not installed")
+
+if not settings.configured:
+    settings.configure(
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+        INSTALLED_APPS=['tests'],
+        USE_TZ=True,
+        TIME_ZONE='Asia/Tashkent',
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from scripts.seed_utils import changed_fields, plan_rows, sync_rows
+
+
+class Dish(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    starts_at = models.DateTimeField(null=True)
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        app_label = 'tests'
+
+
+def sync(rows, batch_size=500):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return sync_rows(Dish, 'name', iter(rows), 'dish', batch_size=batch_size)
+
+
+class ChangedFieldsTests(unittest.TestCase):
+    def test_equal_decimals_with_different_scale(self):
+        self.assertEqual(changed_fields({'price': Decimal('45000')}, {'price': Decimal('45000.00')}), {})
+
+    def test_same_moment_in_another_time_zone(self):
+        moment = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc)
+        tashkent = moment.astimezone(timezone(timedelta(hours=5)))
+        self.assertEqual(changed_fields({'starts_at': tashkent}, {'starts_at': moment}), {})
+
+    def test_reports_only_differing_fields(self):
+        self.assertEqual(changed_fields({'price': Decimal('1'), 'is_active': True},
+                                        {'price': Decimal('2'), 'is_active': True}),
+                         {'price': Decimal('1')})
+
+
+class SyncRowsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        with connection.schema_editor() as editor:
+            editor.create_model(Dish)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as editor:
+            editor.delete_model(Dish)
+        super().tearDownClass()
+
+    def setUp(self):
+        Dish.objects.all().delete()
+
+    def rows(self, count=5, **overrides):
+        return [dict({'name': f"Dish {index}", 'price': f"{index * 1000}.00",
+                      'starts_at': '2026-05-01T09:00:00+05:00', 'is_active': True}, **overrides)
+                for index in range(count)]
+
+    def test_creates_then_reports_unchanged(self):
+        self.assertEqual(sync(self.rows()), {'created': 5, 'updated': 0, 'unchanged': 0})
+        # Satr ko'rinishidagi narx va sana bazadagi qiymatga teng
+        self.assertEqual(sync(self.rows()), {'created': 0, 'updated': 0, 'unchanged': 5})
+
+    def test_updates_only_changed_columns(self):
+        sync(self.rows())
+        rows = self.rows()
+        rows[1]['price'] = '999.00'
+        rows[3]['is_active'] = False
+        self.assertEqual(plan_rows(Dish, 'name', iter(rows)),
+                         {'create': 0, 'update': {('price',): 1, ('is_active',): 1}, 'unchanged': 3})
+        self.assertEqual(sync(rows), {'created': 0, 'updated': 2, 'unchanged': 3})
+        self.assertEqual(Dish.objects.get(name="Dish 1").price, Decimal('999.00'))
+        self.assertFalse(Dish.objects.get(name="Dish 3").is_active)
+
+    def test_duplicate_keys_are_created_once(self):
+        rows = self.rows(2)
+        self.assertEqual(sync(rows + rows), {'created': 2, 'updated': 0, 'unchanged': 0})
+
+    def test_writes_are_flushed_in_batches(self):
+        with CaptureQueriesContext(connection) as queries:
+            sync(self.rows(5), batch_size=2)
+        inserts = [query for query in queries.captured_queries if query['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 3)
+        self.assertEqual(Dish.objects.count(), 5)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(sync(self.rows(5, price='1.00'), batch_size=2)['updated'], 5)
+        updates = [query for query in queries.captured_queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()